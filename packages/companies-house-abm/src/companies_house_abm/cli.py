@@ -93,6 +93,15 @@ def ingest(
             ),
         ),
     ] = True,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-j",
+            min=0,
+            help="Processes used to parse ZIPs (0 = all CPUs, 1 = no parallelism).",
+        ),
+    ] = 1,
 ) -> None:
     """Ingest Companies House XBRL data into a parquet file.
 
@@ -147,14 +156,14 @@ def ingest(
             if not pending:
                 typer.echo("Nothing new to ingest.")
                 raise typer.Exit()
-            new_data = ingest_from_zips(pending)
+            new_data = ingest_from_zips(pending, workers=workers or None)
         else:
             all_zips = sorted(effective_dir.glob("*.zip"))
             if not all_zips:
                 typer.echo(f"No ZIP files found in {effective_dir}.", err=True)
                 raise typer.Exit(code=1)
             typer.echo(f"Ingesting from {len(all_zips)} local ZIP file(s)...")
-            new_data = ingest_from_zips(all_zips)
+            new_data = ingest_from_zips(all_zips, workers=workers or None)
 
     else:
         effective_date = parsed_start_date or infer_start_date(output)
@@ -169,8 +178,8 @@ def ingest(
         raise typer.Exit()
 
     existing_path = output if output.exists() else None
-    result = merge_and_write(new_data, output, existing_path=existing_path)
-    typer.echo(f"Done. {len(result)} total rows in {output}.")
+    n_rows = merge_and_write(new_data, output, existing_path=existing_path)
+    typer.echo(f"Done. {n_rows} total rows in {output}.")
 
 
 @app.command(name="check-company")
@@ -570,6 +579,18 @@ def profile_firms(
             ),
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-j",
+            min=0,
+            help=(
+                "Processes used to fit distributions (0 = all CPUs,"
+                " 1 = no parallelism)."
+            ),
+        ),
+    ] = 1,
 ) -> None:
     """Profile firm financial data and fit statistical distributions.
 
@@ -615,6 +636,7 @@ def profile_firms(
         output_path=output,
         output_format=output_format,
         sample_fraction=sample,
+        workers=workers or None,
     )
 
     typer.echo(
@@ -28,6 +28,7 @@ from companies_house_abm.data_sources.calibration import (
     calibrate_housing,
     calibrate_io_sectors,
     calibrate_model,
+    clear_io_sectors_cache,
 )
 from companies_house_abm.data_sources.firm_distributions import (
     run_profile_pipeline,
@@ -83,6 +84,7 @@ __all__ = [
     "calibrate_housing",
     "calibrate_io_sectors",
     "calibrate_model",
+    "clear_io_sectors_cache",
     "fetch_affordability_ratio",
     "fetch_all_historical",
     "fetch_bank_rate",
@@ -13,9 +13,14 @@ config dataclasses when external data is unavailable.
 
 from __future__ import annotations
 
+import copy
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
 
 from companies_house_abm.abm.config import (
     BankBehaviorConfig,
@@ -39,8 +44,18 @@ from uk_data.workflows.ons import (
     fetch_tenure_distribution,
 )
 
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
 logger = logging.getLogger(__name__)
 
+_C = TypeVar("_C", bound="DataclassInstance")
+
+
+def _with_overrides(base: _C, overrides: dict[str, Any]) -> _C:
+    """Return *base* with *overrides* applied, or *base* itself if none."""
+    return replace(base, **overrides) if overrides else base
+
 
 # ---------------------------------------------------------------------------
 # Household calibration
@@ -101,22 +116,28 @@ def calibrate_households(
 
     # --- MPC from savings ratio ---
     savings_obs = fetch_savings_ratio(limit=4)
-    if savings_obs:
-        try:
-            # Average the last four quarters
-            ratios = [float(o["value"]) for o in savings_obs if o.get("value")]
-            avg_savings_ratio = sum(ratios) / len(ratios) / 100.0  # % → fraction
-            mpc = max(0.5, min(0.99, 1.0 - avg_savings_ratio))
-            overrides["mpc_mean"] = mpc
-            logger.info(
-                "Calibrated household MPC: %.3f (savings ratio %.1f%%)",
-                mpc,
-                avg_savings_ratio * 100,
-            )
-        except (ValueError, ZeroDivisionError):
-            pass
-
-    return replace(base, **overrides)
+    # Average the last four quarters in a single pass.
+    total = 0.0
+    n = 0
+    try:
+        for o in savings_obs:
+            v = o.get("value")
+            if v:
+                total += float(v)
+                n += 1
+    except ValueError:
+        n = 0
+    if n:
+        avg_savings_ratio = total / n / 100.0  # % → fraction
+        mpc = max(0.5, min(0.99, 1.0 - avg_savings_ratio))
+        overrides["mpc_mean"] = mpc
+        logger.info(
+            "Calibrated household MPC: %.3f (savings ratio %.1f%%)",
+            mpc,
+            avg_savings_ratio * 100,
+        )
+
+    return _with_overrides(base, overrides)
 
 
 # ---------------------------------------------------------------------------
@@ -177,8 +198,8 @@ def calibrate_banks(
             behavior_overrides["base_interest_markup"] * 100,
         )
 
-    return replace(base_config, **config_overrides), replace(
-        base_behavior, **behavior_overrides
+    return _with_overrides(base_config, config_overrides), _with_overrides(
+        base_behavior, behavior_overrides
     )
 
 
@@ -236,7 +257,7 @@ def calibrate_government(
     # UK public spending is typically ~42-44% of GDP (OBR Fiscal Outlook 2024).
     fiscal_overrides["spending_gdp_ratio"] = 0.43
 
-    return replace(base_fiscal, **fiscal_overrides), base_transfers
+    return _with_overrides(base_fiscal, fiscal_overrides), base_transfers
 
 
 # ---------------------------------------------------------------------------
@@ -257,6 +278,10 @@ def calibrate_io_sectors() -> dict[str, Any]:
     - Weight sector-level price shocks through the production network.
     - Compute output multipliers for policy shocks.
 
+    The result is computed once per process and cached; each call returns a
+    deep copy, so callers may mutate it freely.  Use
+    :func:`clear_io_sectors_cache` to force a refetch.
+
     Returns:
         Dictionary with keys:
 
@@ -274,6 +299,12 @@ def calibrate_io_sectors() -> dict[str, Any]:
         >>> "sectors" in data and "use_coefficients" in data
         True
     """
+    return copy.deepcopy(_calibrate_io_sectors_cached())
+
+
+@lru_cache(maxsize=1)
+def _calibrate_io_sectors_cached() -> dict[str, Any]:
+    """Compute :func:`calibrate_io_sectors` output (cached)."""
     io_data = fetch_input_output_table()
     sectors = io_data["sectors"]
     use_coeff = io_data["use_coefficients"]
@@ -282,14 +313,16 @@ def calibrate_io_sectors() -> dict[str, Any]:
     # Compute approximate Leontief output multiplier for each sector.
     # The multiplier is 1 / (1 - sum of direct input coefficients).
     # This is an approximation of the full Leontief inverse diagonal element.
-    output_multipliers: dict[str, float] = {}
-    for sector in sectors:
-        total_intermediate_input = sum(use_coeff.get(sector, {}).values())
-        denominator = 1.0 - total_intermediate_input
-        if denominator > 0.01:
-            output_multipliers[sector] = 1.0 / denominator
-        else:
-            output_multipliers[sector] = 1.0  # fallback
+    # Every supplier key counts, including any outside ``sectors``.
+    total_intermediate_input = np.fromiter(
+        (sum(use_coeff.get(s, {}).values()) for s in sectors),
+        dtype=np.float64,
+        count=len(sectors),
+    )
+    denominator = 1.0 - total_intermediate_input
+    multipliers = np.ones_like(denominator)  # fallback
+    np.divide(1.0, denominator, out=multipliers, where=denominator > 0.01)
+    output_multipliers = dict(zip(sectors, multipliers.tolist(), strict=True))
 
     return {
         "sectors": sectors,
@@ -299,6 +332,11 @@ def calibrate_io_sectors() -> dict[str, Any]:
     }
 
 
+def clear_io_sectors_cache() -> None:
+    """Forget the cached :func:`calibrate_io_sectors` result."""
+    _calibrate_io_sectors_cached.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Housing calibration
 # ---------------------------------------------------------------------------
@@ -348,8 +386,8 @@ def calibrate_housing(
     affordability = fetch_affordability_ratio()
     logger.info("Price-to-income affordability ratio: %.1f", affordability)
 
-    return replace(base_properties, **prop_overrides), replace(
-        base_market, **market_overrides
+    return _with_overrides(base_properties, prop_overrides), _with_overrides(
+        base_market, market_overrides
     )
 
 
@@ -365,8 +403,10 @@ def calibrate_model(base: ModelConfig | None = None) -> ModelConfig:
     :func:`calibrate_government` to produce a fully calibrated model
     configuration.
 
-    If any external data source is unavailable, the corresponding
-    parameters fall back to the defaults in *base*.
+    The sub-calibrations hit independent endpoints, so they run
+    concurrently and the wall time is that of the slowest one.  If any
+    external data source is unavailable, or a sub-calibration raises, the
+    corresponding parameters fall back to the defaults in *base*.
 
     Args:
         base: Starting :class:`~companies_house_abm.abm.config.ModelConfig`.
@@ -386,10 +426,36 @@ def calibrate_model(base: ModelConfig | None = None) -> ModelConfig:
     if base is None:
         base = load_config()
 
-    households = calibrate_households(base.households)
-    bank_config, bank_behavior = calibrate_banks(base.banks, base.bank_behavior)
-    fiscal_rule, transfers = calibrate_government(base.fiscal_rule, base.transfers)
-    properties, housing_market = calibrate_housing(base.properties, base.housing_market)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        households_future = pool.submit(calibrate_households, base.households)
+        banks_future = pool.submit(calibrate_banks, base.banks, base.bank_behavior)
+        government_future = pool.submit(
+            calibrate_government, base.fiscal_rule, base.transfers
+        )
+        housing_future = pool.submit(
+            calibrate_housing, base.properties, base.housing_market
+        )
+
+    try:
+        households = households_future.result()
+    except Exception:
+        logger.warning("Household calibration failed; using defaults", exc_info=True)
+        households = base.households
+    try:
+        bank_config, bank_behavior = banks_future.result()
+    except Exception:
+        logger.warning("Bank calibration failed; using defaults", exc_info=True)
+        bank_config, bank_behavior = base.banks, base.bank_behavior
+    try:
+        fiscal_rule, transfers = government_future.result()
+    except Exception:
+        logger.warning("Government calibration failed; using defaults", exc_info=True)
+        fiscal_rule, transfers = base.fiscal_rule, base.transfers
+    try:
+        properties, housing_market = housing_future.result()
+    except Exception:
+        logger.warning("Housing calibration failed; using defaults", exc_info=True)
+        properties, housing_market = base.properties, base.housing_market
 
     return replace(
         base,
@@ -35,7 +35,10 @@ from __future__ import annotations
 import datetime
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -44,6 +47,7 @@ import yaml
 from scipy import stats
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from pathlib import Path
     from typing import Any
 
@@ -54,10 +58,7 @@ logger = logging.getLogger(__name__)
 # SIC Division → ABM Sector mapping
 # =====================================================================
 
-#: Map from 2-digit SIC division prefix to ABM sector name.
-#: Based on the UK SIC 2007 classification and the 13-sector taxonomy
-#: defined in :class:`~companies_house_abm.abm.config.FirmConfig`.
-SIC_TO_SECTOR: dict[str, str] = {
+_SIC_TO_SECTOR: dict[str, str] = {
     # Agriculture, forestry and fishing: SIC divisions 01 to 03
     "01": "agriculture",
     "02": "agriculture",
@@ -142,6 +143,12 @@ SIC_TO_SECTOR: dict[str, str] = {
     "99": "other_services",
 }
 
+#: Map from 2-digit SIC division prefix to ABM sector name.
+#: Based on the UK SIC 2007 classification and the 13-sector taxonomy
+#: defined in :class:`~companies_house_abm.abm.config.FirmConfig`.
+#: Read-only, so it can be shared safely, including across threads.
+SIC_TO_SECTOR: Mapping[str, str] = MappingProxyType(_SIC_TO_SECTOR)
+
 #: Columns from the parquet that map to Firm agent constructor arguments.
 FIRM_FIELD_MAP: dict[str, str] = {
     "employees": "average_number_employees_during_period",
@@ -157,6 +164,18 @@ DEBT_COLUMNS: tuple[str, ...] = (
     "creditors_due_after_one_year",
 )
 
+#: Columns read by :func:`run_profile_pipeline` for profiling and fitting.
+_PIPELINE_COLUMNS: tuple[str, ...] = (
+    "company_id",
+    "balance_sheet_date",
+    "sector",
+    "financial_year",
+    *FIRM_FIELD_MAP.values(),
+    *DEBT_COLUMNS,
+    "debt_total",
+    "profit_loss_for_period",
+)
+
 #: Candidate distribution families for scipy fitting.
 CANDIDATE_DISTRIBUTIONS: tuple[str, ...] = (
     "lognorm",
@@ -166,6 +185,18 @@ CANDIDATE_DISTRIBUTIONS: tuple[str, ...] = (
     "pareto",
 )
 
+#: Names of the positional parameters returned by ``dist.fit()``.
+_PARAM_NAMES: dict[str, tuple[str, ...]] = {
+    "lognorm": ("s", "loc", "scale"),
+    "gamma": ("a", "loc", "scale"),
+    "expon": ("loc", "scale"),
+    "norm": ("loc", "scale"),
+    "pareto": ("b", "loc", "scale"),
+}
+
+#: Families whose support is the positive reals; fitted on ``x > 0`` only.
+_POSITIVE_SUPPORT: frozenset[str] = frozenset({"lognorm", "gamma", "pareto", "expon"})
+
 #: Minimum number of non-null observations required to attempt a fit.
 MIN_OBSERVATIONS: int = 30
 
@@ -208,7 +239,7 @@ class DataProfile:
     fields: list[FieldProfile]
 
 
-@dataclass
+@dataclass(slots=True)
 class FittedDistribution:
     """Result of fitting a statistical distribution to observed data."""
 
@@ -221,7 +252,7 @@ class FittedDistribution:
     n_observations: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SectorYearParameters:
     """Fitted distribution parameters for one sector in one year."""
 
@@ -283,21 +314,23 @@ def load_accounts(
     # Drop rows with errors.
     # NOTE: cast to Utf8 first to work around a Polars predicate-pushdown
     # bug where filtering `is_null()` on an all-null string column read
-    # from parquet raises a ShapeError.
+    # from parquet raises a ShapeError.  The cast lives inside the
+    # predicate so that the filter still reaches the scan.
     if drop_errors:
-        lf = lf.with_columns(pl.col("error").cast(pl.Utf8)).filter(
-            pl.col("error").is_null()
-        )
+        lf = lf.filter(pl.col("error").cast(pl.Utf8).is_null())
 
     # Drop dormant companies
     if drop_dormant:
         lf = lf.filter(pl.col("company_dormant").is_null() | ~pl.col("company_dormant"))
 
-    # Clean date outliers: only keep balance_sheet_date in [1990, 2030]
+    # Clean date outliers: only keep balance_sheet_date in [1990, 2030].
+    # A plain range on the column (rather than on dt.year()) lets the
+    # parquet reader skip row groups using min/max statistics; nulls fail
+    # the comparison and are dropped too.
     lf = lf.filter(
-        pl.col("balance_sheet_date").is_not_null()
-        & (pl.col("balance_sheet_date").dt.year() >= 1990)
-        & (pl.col("balance_sheet_date").dt.year() <= 2030)
+        pl.col("balance_sheet_date").is_between(
+            datetime.date(1990, 1, 1), datetime.date(2030, 12, 31)
+        )
     )
 
     # Derive financial year
@@ -338,10 +371,8 @@ def map_sic_to_sector(sic_code: str) -> str:
         The corresponding ABM sector name, or ``"other_services"``
         if the code cannot be mapped.
     """
-    if not sic_code or len(sic_code) < 2:
-        return "other_services"
-    prefix = sic_code[:2]
-    return SIC_TO_SECTOR.get(prefix, "other_services")
+    # Empty and one-character codes slice to keys that are not in the map.
+    return SIC_TO_SECTOR.get(sic_code[:2], "other_services")
 
 
 def assign_sectors(
@@ -379,21 +410,14 @@ def assign_sectors(
             pl.col("sic_code").cast(pl.Utf8),
         )
 
-        # Map SIC codes to sectors
-        sic_sector_map = pl.DataFrame(
-            {
-                "sic_prefix": list(SIC_TO_SECTOR.keys()),
-                "sector": list(SIC_TO_SECTOR.values()),
-            }
-        ).lazy()
-
-        sic_df = sic_df.with_columns(
-            pl.col("sic_code").str.slice(0, 2).alias("sic_prefix")
+        # Map SIC division prefixes to sectors in one vectorised lookup.
+        sic_df = sic_df.select(
+            "companies_house_registered_number",
+            pl.col("sic_code")
+            .str.slice(0, 2)
+            .replace_strict(SIC_TO_SECTOR, default="other_services")
+            .alias("sector"),
         )
-        sic_df = sic_df.join(sic_sector_map, on="sic_prefix", how="left")
-        sic_df = sic_df.with_columns(
-            pl.col("sector").fill_null("other_services")
-        ).select("companies_house_registered_number", "sector")
 
         # Deduplicate SIC data (one sector per company)
         sic_df = sic_df.unique(
@@ -420,6 +444,65 @@ def assign_sectors(
 # =====================================================================
 
 
+def _profile_expr(
+    name: str,
+    outlier_quantiles: tuple[float, float] = OUTLIER_QUANTILES,
+) -> pl.Expr:
+    """Build one struct aggregation holding every statistic for *name*.
+
+    All statistics come out of a single ``select``, so Polars evaluates
+    them together instead of scanning the column once per statistic.
+    Aggregations skip nulls, matching a profile of the non-null values.
+    """
+    col = pl.col(name).cast(pl.Float64, strict=False)
+    q_low = col.quantile(outlier_quantiles[0], interpolation="linear")
+    q_high = col.quantile(outlier_quantiles[1], interpolation="linear")
+    return pl.struct(
+        count=pl.len(),
+        null_count=col.null_count(),
+        mean=col.mean(),
+        std=col.std(),
+        min=col.min(),
+        q25=col.quantile(0.25, interpolation="linear"),
+        median=col.median(),
+        q75=col.quantile(0.75, interpolation="linear"),
+        max=col.max(),
+        outlier_low=q_low,
+        outlier_high=q_high,
+        outlier_count=((col < q_low) | (col > q_high)).sum(),
+    ).alias(name)
+
+
+def _field_profile(name: str, row: dict[str, Any]) -> FieldProfile:
+    """Unpack one :func:`_profile_expr` result into a :class:`FieldProfile`."""
+    total = int(row["count"])
+    null_count = int(row["null_count"])
+    null_pct = (null_count / total * 100) if total > 0 else 0.0
+    if null_count == total:
+        return FieldProfile(
+            name=name,
+            count=total,
+            null_count=null_count,
+            null_pct=null_pct,
+        )
+    return FieldProfile(
+        name=name,
+        count=total,
+        null_count=null_count,
+        null_pct=null_pct,
+        mean=row["mean"],
+        std=row["std"],
+        min=row["min"],
+        q25=row["q25"],
+        median=row["median"],
+        q75=row["q75"],
+        max=row["max"],
+        outlier_low=row["outlier_low"],
+        outlier_high=row["outlier_high"],
+        outlier_count=int(row["outlier_count"] or 0),
+    )
+
+
 def profile_field(
     series: pl.Series,
     *,
@@ -435,44 +518,8 @@ def profile_field(
     Returns:
         A :class:`FieldProfile` with the computed statistics.
     """
-    total = len(series)
-    null_count = series.null_count()
-    null_pct = (null_count / total * 100) if total > 0 else 0.0
-
-    non_null = series.drop_nulls()
-    if len(non_null) == 0:
-        return FieldProfile(
-            name=series.name,
-            count=total,
-            null_count=null_count,
-            null_pct=null_pct,
-        )
-
-    q_low = non_null.quantile(outlier_quantiles[0], interpolation="linear")
-    q_high = non_null.quantile(outlier_quantiles[1], interpolation="linear")
-    outlier_count = 0
-    if q_low is not None and q_high is not None:
-        outlier_count = int(((non_null < q_low) | (non_null > q_high)).sum())
-
-    def _f(v: object) -> float | None:
-        return float(v) if v is not None else None  # type: ignore[arg-type]
-
-    return FieldProfile(
-        name=series.name,
-        count=total,
-        null_count=null_count,
-        null_pct=null_pct,
-        mean=_f(non_null.mean()),
-        std=_f(non_null.std()),
-        min=_f(non_null.min()),
-        q25=_f(non_null.quantile(0.25, interpolation="linear")),
-        median=_f(non_null.median()),
-        q75=_f(non_null.quantile(0.75, interpolation="linear")),
-        max=_f(non_null.max()),
-        outlier_low=_f(q_low),
-        outlier_high=_f(q_high),
-        outlier_count=outlier_count,
-    )
+    stats_row = series.to_frame().select(_profile_expr(series.name, outlier_quantiles))
+    return _field_profile(series.name, stats_row.item())
 
 
 def profile_accounts(df: pl.DataFrame) -> DataProfile:
@@ -498,11 +545,12 @@ def profile_accounts(df: pl.DataFrame) -> DataProfile:
         "profit_loss_for_period",
     ]
 
-    field_profiles = []
-    for col_name in fields_to_profile:
-        if col_name in df.columns:
-            series = df[col_name].cast(pl.Float64, strict=False)
-            field_profiles.append(profile_field(series))
+    # Profile every field in one pass rather than one select per column.
+    present = [c for c in fields_to_profile if c in df.columns]
+    field_profiles: list[FieldProfile] = []
+    if present:
+        stats_row = df.select(_profile_expr(c) for c in present).row(0, named=True)
+        field_profiles = [_field_profile(c, stats_row[c]) for c in present]
 
     return DataProfile(
         total_rows=total_rows,
@@ -536,27 +584,36 @@ def fit_distribution(
         The best-fitting distribution, or ``None`` when there are
         fewer than :data:`MIN_OBSERVATIONS` data points.
     """
-    clean = values.drop_nulls().to_numpy().astype(np.float64)
+    # A null-free Float64 series converts without copying, and nulls come
+    # through as NaN, so one finite mask drops nulls and infinities alike.
+    clean = values.cast(pl.Float64).to_numpy()
     clean = clean[np.isfinite(clean)]
 
     if len(clean) < MIN_OBSERVATIONS:
         return None
 
+    # Shared by every positive-support family instead of re-masking per fit.
+    positive = clean[clean > 0]
+    positive_ok = len(positive) >= MIN_OBSERVATIONS
+
     best: FittedDistribution | None = None
     best_aic = float("inf")
 
-    for dist_name in candidates:
-        dist = getattr(stats, dist_name, None)
-        if dist is None:
-            continue
+    # Resolve the scipy families once, skipping names scipy does not know.
+    families = [
+        (name, dist)
+        for name in candidates
+        if (dist := getattr(stats, name, None)) is not None
+    ]
 
+    for dist_name, dist in families:
         try:
             # Some distributions only work with positive data
             data = clean
-            if dist_name in ("lognorm", "gamma", "pareto", "expon"):
-                data = data[data > 0]
-                if len(data) < MIN_OBSERVATIONS:
+            if dist_name in _POSITIVE_SUPPORT:
+                if not positive_ok:
                     continue
+                data = positive
 
             params = dist.fit(data)
             log_likelihood = np.sum(dist.logpdf(data, *params))
@@ -603,16 +660,9 @@ def _distribution_param_names(
     Returns:
         Dictionary mapping parameter names to values.
     """
-    if dist_name == "lognorm":
-        return {"s": params[0], "loc": params[1], "scale": params[2]}
-    if dist_name == "gamma":
-        return {"a": params[0], "loc": params[1], "scale": params[2]}
-    if dist_name == "expon":
-        return {"loc": params[0], "scale": params[1]}
-    if dist_name == "norm":
-        return {"loc": params[0], "scale": params[1]}
-    if dist_name == "pareto":
-        return {"b": params[0], "loc": params[1], "scale": params[2]}
+    names = _PARAM_NAMES.get(dist_name)
+    if names is not None:
+        return dict(zip(names, params, strict=True))
     # Generic fallback
     return {f"p{i}": float(v) for i, v in enumerate(params)}
 
@@ -627,10 +677,37 @@ def _firm_fields() -> list[str]:
     return [*FIRM_FIELD_MAP.keys(), "debt"]
 
 
+def _fit_all(
+    jobs: list[tuple[pl.Series, str]],
+    candidates: tuple[str, ...],
+    workers: int | None,
+) -> list[FittedDistribution | None]:
+    """Run :func:`fit_distribution` over *jobs*, in order.
+
+    Each fit is independent, CPU-bound scipy work, so with more than one
+    worker the jobs are spread across a process pool.
+    """
+    if workers == 1 or len(jobs) <= 1:
+        return [fit_distribution(s, name, candidates) for s, name in jobs]
+
+    n_procs = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=n_procs) as pool:
+        return list(
+            pool.map(
+                fit_distribution,
+                [s for s, _ in jobs],
+                [name for _, name in jobs],
+                [candidates] * len(jobs),
+                chunksize=max(1, len(jobs) // (4 * n_procs)),
+            )
+        )
+
+
 def compute_sector_year_parameters(
     df: pl.DataFrame,
     *,
     candidates: tuple[str, ...] = CANDIDATE_DISTRIBUTIONS,
+    workers: int | None = 1,
 ) -> list[SectorYearParameters]:
     """Fit distributions to firm fields grouped by sector and year.
 
@@ -638,39 +715,60 @@ def compute_sector_year_parameters(
         df: Collected accounts DataFrame with ``sector`` and
             ``financial_year`` columns.
         candidates: Distribution families to try.
+        workers: Number of processes to fit with.  ``1`` fits serially
+            in the calling process; ``None`` uses every available CPU.
 
     Returns:
         A list of :class:`SectorYearParameters`, one per
         (sector, year) combination that has enough data.
     """
-    results: list[SectorYearParameters] = []
     field_names = _firm_fields()
 
     # Build column mapping for extraction
     col_map: dict[str, str] = {**FIRM_FIELD_MAP, "debt": "debt_total"}
 
-    groups = df.group_by(["sector", "financial_year"])
-    for (sector, fy), group_df in groups:
-        distributions: list[FittedDistribution] = []
+    fields = [
+        (firm_field, parquet_col)
+        for firm_field in field_names
+        if (parquet_col := col_map.get(firm_field, firm_field)) in df.columns
+    ]
+    # Partition only the fitted columns (cast once, up front) rather than
+    # every column of the accounts frame.
+    fitted_df = df.select(
+        "sector",
+        "financial_year",
+        *(pl.col(c).cast(pl.Float64, strict=False) for _, c in fields),
+    )
 
-        for firm_field in field_names:
-            parquet_col = col_map.get(firm_field, firm_field)
-            if parquet_col not in group_df.columns:
-                continue
-            series = group_df[parquet_col].cast(pl.Float64, strict=False)
-            fitted = fit_distribution(series, firm_field, candidates)
-            if fitted is not None:
-                distributions.append(fitted)
-
-        if distributions:
-            results.append(
-                SectorYearParameters(
-                    sector=str(sector),
-                    financial_year=int(fy),
-                    n_companies=len(group_df),
-                    distributions=distributions,
-                )
-            )
+    # Collect every (group, field) fit first so they can run in parallel.
+    group_keys: list[tuple[str, int, int]] = []
+    jobs: list[tuple[pl.Series, str]] = []
+    job_groups: list[int] = []
+    for (sector, fy), group_df in fitted_df.group_by(["sector", "financial_year"]):
+        for firm_field, parquet_col in fields:
+            jobs.append((group_df[parquet_col], firm_field))
+            job_groups.append(len(group_keys))
+        group_keys.append((str(sector), int(fy), len(group_df)))
+
+    distributions: list[list[FittedDistribution]] = [[] for _ in group_keys]
+    for group, fitted in zip(
+        job_groups, _fit_all(jobs, candidates, workers), strict=True
+    ):
+        if fitted is not None:
+            distributions[group].append(fitted)
+
+    results = [
+        SectorYearParameters(
+            sector=sector,
+            financial_year=fy,
+            n_companies=n_companies,
+            distributions=fitted,
+        )
+        for (sector, fy, n_companies), fitted in zip(
+            group_keys, distributions, strict=True
+        )
+        if fitted
+    ]
 
     # Sort for deterministic output
     results.sort(key=lambda r: (r.sector, r.financial_year))
@@ -706,6 +804,10 @@ def build_summary(
 # I/O helpers
 # =====================================================================
 
+#: PyYAML's libyaml-backed dumper when available.  It uses the same
+#: representers as :class:`yaml.Dumper`, so the output is identical.
+_YAML_DUMPER: type[Any] = getattr(yaml, "CDumper", yaml.Dumper)
+
 
 def save_parameters_yaml(summary: FirmDistributionSummary, path: Path) -> None:
     """Write the fitted parameters to a YAML file.
@@ -716,10 +818,17 @@ def save_parameters_yaml(summary: FirmDistributionSummary, path: Path) -> None:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     data = _summary_to_dict(summary)
-    path.write_text(
-        yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False),
-        encoding="utf-8",
-    )
+    # Emit straight into the file rather than building the document as one
+    # string first, using libyaml's C emitter when PyYAML was built with it.
+    with path.open("w", encoding="utf-8") as fh:
+        yaml.dump(
+            data,
+            fh,
+            Dumper=_YAML_DUMPER,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
     logger.info("Parameters written to %s", path)
 
 
@@ -732,10 +841,8 @@ def save_parameters_json(summary: FirmDistributionSummary, path: Path) -> None:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     data = _summary_to_dict(summary)
-    path.write_text(
-        json.dumps(data, indent=2, default=str),
-        encoding="utf-8",
-    )
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, default=str)
     logger.info("Parameters written to %s", path)
 
 
@@ -756,6 +863,7 @@ def run_profile_pipeline(
     output_path: Path | None = None,
     output_format: str = "yaml",
     sample_fraction: float | None = None,
+    workers: int | None = 1,
 ) -> FirmDistributionSummary:
     """Run the full profiling and distribution-fitting pipeline.
 
@@ -769,6 +877,8 @@ def run_profile_pipeline(
         output_format: ``"yaml"`` or ``"json"``.
         sample_fraction: Fraction of data to sample (for speed).
             ``None`` uses all data.
+        workers: Processes used for distribution fitting; see
+            :func:`compute_sector_year_parameters`.
 
     Returns:
         The :class:`FirmDistributionSummary` with all fitted parameters.
@@ -777,13 +887,15 @@ def run_profile_pipeline(
     lf = load_accounts(parquet_path)
     lf = assign_sectors(lf, sic_path)
 
+    # Only these columns are profiled or fitted; projecting them before
+    # collecting lets the parquet scan skip every other column.
+    available = set(lf.collect_schema().names())
+    lf = lf.select(c for c in _PIPELINE_COLUMNS if c in available)
+    df: pl.DataFrame = lf.collect()
+
     if sample_fraction is not None:
         logger.info("Sampling %.1f%% of data", sample_fraction * 100)
-        # Collect and sample — sampling a lazy frame requires collecting
-        df: pl.DataFrame = lf.collect()
         df = df.sample(fraction=sample_fraction, seed=42)
-    else:
-        df: pl.DataFrame = lf.collect()
 
     logger.info("Loaded %d rows for %d companies", len(df), df["company_id"].n_unique())
 
@@ -798,7 +910,7 @@ def run_profile_pipeline(
     )
 
     # Fit distributions
-    parameters = compute_sector_year_parameters(df)
+    parameters = compute_sector_year_parameters(df, workers=workers)
     summary = build_summary(parameters, profile.total_companies)
 
     logger.info(
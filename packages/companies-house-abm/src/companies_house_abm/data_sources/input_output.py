@@ -15,7 +15,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from uk_data.adapters.ons import _latest_float
+from uk_data.adapters.ons import _latest_floats
 
 logger = logging.getLogger(__name__)
 
@@ -189,9 +189,10 @@ def fetch_input_output_table() -> dict[str, Any]:
     """
     final_demand_shares = dict(_FINAL_DEMAND_SHARES)
 
+    latest = _latest_floats(list(_GVA_SERIES.values()))
     gva_values: dict[str, float] = {}
     for sector, sid in _GVA_SERIES.items():
-        val = _latest_float(sid)
+        val = latest[sid]
         if val is not None and val > 0:
             gva_values[sector] = val
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
@@ -29,6 +31,9 @@ from companies_house_abm.abm.config import (
 )
 from companies_house_abm.abm.model import Simulation
 from companies_house_abm.webapp.models import (
+    N_FIRMS_BOUNDS,
+    N_HOUSEHOLDS_BOUNDS,
+    PERIODS_BOUNDS,
     DefaultsResponse,
     PeriodData,
     SimulationParams,
@@ -46,6 +51,9 @@ app = FastAPI(
     version="0.1.0",
 )
 
+# Simulation results are large, repetitive JSON; compress them (and the static
+# assets) for clients that accept gzip.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
 
 
@@ -60,6 +68,21 @@ def index() -> FileResponse:
 # ---------------------------------------------------------------------------
 
 
+# Fields whose YAML values may exceed what the web UI accepts, with the same
+# bounds the SimulationParams fields declare.
+_CLAMP_BOUNDS: dict[str, tuple[int, int]] = {
+    "periods": PERIODS_BOUNDS,
+    "n_firms": N_FIRMS_BOUNDS,
+    "n_households": N_HOUSEHOLDS_BOUNDS,
+}
+
+
+def _clamp(name: str, value: int) -> int:
+    """Clamp *value* into the declared bounds of the *name* field."""
+    lo, hi = _CLAMP_BOUNDS[name]
+    return max(lo, min(hi, int(value)))
+
+
 def _config_to_params(cfg: object) -> SimulationParams:
     """Convert a :class:`ModelConfig` to a flat :class:`SimulationParams`.
 
@@ -69,15 +92,12 @@ def _config_to_params(cfg: object) -> SimulationParams:
     if not isinstance(cfg, ModelConfig):
         return SimulationParams()
 
-    def _clamp(v: float, lo: float, hi: float) -> float:
-        return max(lo, min(hi, v))
-
     return SimulationParams(
         # Simulation
-        periods=int(_clamp(cfg.simulation.periods, 10, 400)),
+        periods=_clamp("periods", cfg.simulation.periods),
         seed=cfg.simulation.seed,
         # Firms — population
-        n_firms=int(_clamp(cfg.firms.sample_size, 10, 100_000)),
+        n_firms=_clamp("n_firms", cfg.firms.sample_size),
         firm_entry_rate=cfg.firms.entry_rate,
         firm_exit_threshold=cfg.firms.exit_threshold,
         # Firms — behaviour
@@ -88,7 +108,7 @@ def _config_to_params(cfg: object) -> SimulationParams:
         investment_sensitivity=cfg.firm_behavior.investment_sensitivity,
         wage_adjustment_speed=cfg.firm_behavior.wage_adjustment_speed,
         # Households — population
-        n_households=int(_clamp(cfg.households.count, 50, 50_000)),
+        n_households=_clamp("n_households", cfg.households.count),
         income_mean=cfg.households.income_mean,
         income_std=cfg.households.income_std,
         wealth_shape=cfg.households.wealth_shape,
@@ -235,11 +255,20 @@ def _params_to_config(params: SimulationParams) -> ModelConfig:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
+def _default_config() -> ModelConfig:
+    """Load the shipped config file (cached).
+
+    The file does not change while the server runs, so it is read once per
+    process.  :class:`ModelConfig` is frozen, so sharing it is safe.
+    """
+    return load_config()
+
+
 @app.get("/api/defaults", response_model=DefaultsResponse)
 def get_defaults() -> DefaultsResponse:
     """Return the default simulation parameters loaded from the config file."""
-    cfg = load_config()
-    return DefaultsResponse(params=_config_to_params(cfg))
+    return DefaultsResponse(params=_config_to_params(_default_config()))
 
 
 @app.post("/api/simulate", response_model=SimulationResponse)
@@ -5,19 +5,33 @@ from __future__ import annotations
 from pydantic import BaseModel, Field
 from pydantic.dataclasses import dataclass
 
+#: ``(min, max)`` accepted for the population-size fields.  The web app also
+#: clamps YAML defaults into these, so they are declared once here.
+PERIODS_BOUNDS: tuple[int, int] = (10, 400)
+N_FIRMS_BOUNDS: tuple[int, int] = (10, 100_000)
+N_HOUSEHOLDS_BOUNDS: tuple[int, int] = (50, 50_000)
 
-@dataclass
+
+@dataclass(slots=True)
 class SimulationParams:
     """Parameters configuring a simulation run."""
 
     # ── Simulation ────────────────────────────────────────────────────────────
     periods: int = Field(
-        80, ge=10, le=400, description="Number of quarters to simulate"
+        80,
+        ge=PERIODS_BOUNDS[0],
+        le=PERIODS_BOUNDS[1],
+        description="Number of quarters to simulate",
     )
     seed: int = Field(42, ge=0, description="Random seed for reproducibility")
 
     # ── Firms — population ───────────────────────────────────────────────────
-    n_firms: int = Field(100, ge=10, le=100_000, description="Number of firm agents")
+    n_firms: int = Field(
+        100,
+        ge=N_FIRMS_BOUNDS[0],
+        le=N_FIRMS_BOUNDS[1],
+        description="Number of firm agents",
+    )
     firm_entry_rate: float = Field(
         0.02, ge=0.0, le=0.20, description="Firm entry rate per period"
     )
@@ -50,7 +64,10 @@ class SimulationParams:
 
     # ── Households — population ──────────────────────────────────────────────
     n_households: int = Field(
-        500, ge=50, le=50_000, description="Number of household agents"
+        500,
+        ge=N_HOUSEHOLDS_BOUNDS[0],
+        le=N_HOUSEHOLDS_BOUNDS[1],
+        description="Number of household agents",
     )
     income_mean: float = Field(
         35_000.0,
@@ -204,7 +221,7 @@ class SimulationParams:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PeriodData:
     """Aggregate statistics for a single period."""
 
@@ -87,6 +87,15 @@ def ingest(
             help="DuckDB database path (uses upsert instead of parquet).",
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-j",
+            min=0,
+            help="Processes used to parse ZIPs (0 = all CPUs, 1 = no parallelism).",
+        ),
+    ] = 1,
 ) -> None:
     """Ingest Companies House XBRL data.
 
@@ -129,7 +138,7 @@ def ingest(
             if not pending:
                 typer.echo("Nothing new to ingest.")
                 raise typer.Exit()
-            new_data = ingest_from_zips(pending)
+            new_data = ingest_from_zips(pending, workers=workers or None)
         else:
             all_zips = sorted(effective_dir.glob("*.zip"))
             if not all_zips:
@@ -139,7 +148,7 @@ def ingest(
                 )
                 raise typer.Exit(code=1)
             typer.echo(f"Ingesting from {len(all_zips)} local ZIP file(s)...")
-            new_data = ingest_from_zips(all_zips)
+            new_data = ingest_from_zips(all_zips, workers=workers or None)
     else:
         effective_date = parsed_start_date or infer_start_date(output)
         if effective_date is not None:
@@ -161,8 +170,8 @@ def ingest(
             typer.echo(f"Done. Upserted {count} rows into {db_path}.")
     else:
         existing_path = output if output.exists() else None
-        result = merge_and_write(new_data, output, existing_path=existing_path)
-        typer.echo(f"Done. {len(result)} total rows in {output}.")
+        n_rows = merge_and_write(new_data, output, existing_path=existing_path)
+        typer.echo(f"Done. {n_rows} total rows in {output}.")
 
 
 @app.command(name="check-company")
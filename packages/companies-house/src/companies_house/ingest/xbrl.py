@@ -7,30 +7,46 @@ archives transparently via ``stream-read-xbrl``.
 from __future__ import annotations
 
 import io
+import itertools
 import logging
+import os
+import tempfile
 import urllib.error
 import urllib.request
 import zipfile
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
 
 import polars as pl
+import pyarrow as pa
 from stream_read_xbrl import stream_read_xbrl_sync, stream_read_xbrl_zip
 
 from companies_house.schema import COMPANIES_HOUSE_SCHEMA, DEDUP_COLUMNS
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Generator, Iterable, Sequence
     from datetime import date
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 _USER_AGENT = (
     "companies-house/ingest (+https://github.com/jstammers/companies-house-abm)"
 )
 # Byte ranges used when fetching just the ZIP central directory via HTTP Range.
 _INITIAL_RANGE_BYTES = 33_554_432  # 32 MB
 _RETRY_RANGE_BYTES = 67_108_864  # 64 MB
+# Rows per row group in the merged accounts parquet; fewer, larger groups
+# compress better while still carrying per-group ``date`` statistics.
+_PARQUET_ROW_GROUP_SIZE = 500_000
+# Read size when feeding a local ZIP to the XBRL stream parser.
+_ZIP_CHUNK_SIZE = 1 << 20  # 1 MB
+# Rows converted to a DataFrame at a time while draining an XBRL row stream.
+_ROW_BATCH_SIZE = 50_000
+# Arrow form of COMPANIES_HOUSE_SCHEMA, for building row batches column-wise.
+_ARROW_SCHEMA = pl.DataFrame(schema=COMPANIES_HOUSE_SCHEMA).to_arrow().schema
 
 
 # ---------------------------------------------------------------------------
@@ -55,8 +71,11 @@ def infer_start_date(parquet_path: Path) -> date | None:
         return None
 
 
-def deduplicate(df: pl.DataFrame) -> pl.DataFrame:
-    """Remove duplicate rows, keeping the last occurrence."""
+def deduplicate(df: FrameT) -> FrameT:
+    """Remove duplicate rows, keeping the last occurrence.
+
+    Accepts an eager or lazy frame and returns the same kind.
+    """
     return df.unique(subset=DEDUP_COLUMNS, keep="last", maintain_order=True)
 
 
@@ -66,36 +85,88 @@ def deduplicate(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def _zip_bytes_iter(zip_path: Path) -> Generator[bytes]:
-    """Yield 64KB chunks from a local ZIP file."""
-    chunk_size = 64 * 1024
-    with zip_path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
+    """Yield 1 MB chunks from a local ZIP file.
+
+    The file is opened unbuffered: each chunk is a single ``read`` into a
+    fresh bytes object, with no intermediate copy through a Python buffer.
+    """
+    with zip_path.open("rb", buffering=0) as f:
+        while chunk := f.read(_ZIP_CHUNK_SIZE):
             yield chunk
 
 
-def ingest_from_zips(zip_paths: Sequence[Path]) -> pl.DataFrame:
+def _batch_to_frame(batch: list[Sequence[object]]) -> pl.DataFrame:
+    """Build a schema-typed DataFrame from one batch of row tuples.
+
+    The rows are transposed and each column becomes a typed Arrow array,
+    which is several times faster than Polars' row-oriented constructor.
+    Arrow rejects values Polars would coerce (e.g. a decimal with more
+    places than the schema's scale, which Polars rounds), so such a batch
+    falls back to the row constructor to keep the same result.
+    """
+    columns = zip(*batch, strict=True)
+    try:
+        arrays = [
+            pa.array(column, type=field.type)
+            for column, field in zip(columns, _ARROW_SCHEMA, strict=True)
+        ]
+    except pa.ArrowException:
+        return pl.DataFrame(batch, orient="row", schema=COMPANIES_HOUSE_SCHEMA)
+    return pl.from_arrow(pa.table(arrays, schema=_ARROW_SCHEMA))
+
+
+def _rows_to_frame(rows: Iterable[Sequence[object]]) -> pl.DataFrame:
+    """Build a schema-typed DataFrame from *rows* in fixed-size batches.
+
+    Only one batch of Python row tuples is alive at a time, so peak memory
+    is bounded by the batch rather than the whole stream.
+    """
+    it = iter(rows)
+    parts: list[pl.DataFrame] = []
+    while batch := list(itertools.islice(it, _ROW_BATCH_SIZE)):
+        parts.append(_batch_to_frame(batch))
+    if not parts:
+        return pl.DataFrame(schema=COMPANIES_HOUSE_SCHEMA)
+    return pl.concat(parts)
+
+
+def _ingest_zip(zip_path: Path) -> pl.DataFrame | None:
+    """Ingest one local ZIP, returning ``None`` if it is corrupt or unreadable."""
+    chunks = _zip_bytes_iter(zip_path)
+    try:
+        with stream_read_xbrl_zip(chunks, zip_url=str(zip_path)) as (_columns, rows):
+            df = _rows_to_frame(rows)
+    except Exception:
+        logger.warning("Skipping corrupt ZIP: %s", zip_path, exc_info=True)
+        return None
+    logger.info("Ingested %d rows from %s", len(df), zip_path)
+    return df
+
+
+def ingest_from_zips(
+    zip_paths: Sequence[Path], *, workers: int | None = 1
+) -> pl.DataFrame:
     """Process local ZIP files via ``stream_read_xbrl_zip``.
 
-    Corrupt or unreadable ZIPs are logged and skipped.
+    Corrupt or unreadable ZIPs are logged and skipped.  Each ZIP is parsed
+    independently, so with more than one worker the archives are spread
+    across a process pool; rows keep the order of *zip_paths* either way.
+
+    Parameters
+    ----------
+    zip_paths:
+        Local ZIP archives to ingest.
+    workers:
+        Number of processes to parse with.  ``1`` parses serially
+        in-process; ``None`` uses one process per CPU.
     """
-    frames: list[pl.DataFrame] = []
-    for zip_path in zip_paths:
-        try:
-            with stream_read_xbrl_zip(
-                _zip_bytes_iter(zip_path), zip_url=str(zip_path)
-            ) as (_columns, rows):
-                df = pl.DataFrame(
-                    list(rows),
-                    orient="row",
-                    schema=COMPANIES_HOUSE_SCHEMA,
-                )
-                frames.append(df)
-                logger.info("Ingested %d rows from %s", len(df), zip_path)
-        except Exception:
-            logger.warning("Skipping corrupt ZIP: %s", zip_path, exc_info=True)
+    if workers == 1 or len(zip_paths) <= 1:
+        results = [_ingest_zip(zip_path) for zip_path in zip_paths]
+    else:
+        n_procs = min(workers or os.cpu_count() or 1, len(zip_paths))
+        with ProcessPoolExecutor(max_workers=n_procs) as pool:
+            results = list(pool.map(_ingest_zip, zip_paths))
+    frames = [df for df in results if df is not None]
     if not frames:
         return pl.DataFrame(schema=COMPANIES_HOUSE_SCHEMA)
     return pl.concat(frames)
@@ -118,11 +189,7 @@ def ingest_from_stream(*, start_date: date | None = None) -> pl.DataFrame:
         ingest_data_after_date=after_date,
     ) as (_columns, date_range_and_rows):
         for (batch_start, batch_end), rows in date_range_and_rows:
-            df = pl.DataFrame(
-                list(rows),
-                orient="row",
-                schema=COMPANIES_HOUSE_SCHEMA,
-            )
+            df = _rows_to_frame(rows)
             frames.append(df)
             logger.info(
                 "Ingested %d rows for %s to %s",
@@ -140,18 +207,39 @@ def merge_and_write(
     output_path: Path,
     *,
     existing_path: Path | None = None,
-) -> pl.DataFrame:
-    """Concat with existing parquet, deduplicate, and write."""
+) -> int:
+    """Concat with existing parquet, deduplicate, and write.
+
+    The existing parquet is scanned lazily and the deduplicated result is
+    streamed to a temporary file beside *output_path*, then renamed into
+    place.  *existing_path* may therefore be *output_path* itself, and a
+    failed write never leaves a truncated output behind.
+
+    Returns:
+        Number of rows in the written parquet, read from its metadata so the
+        merged table is never materialised in memory.
+    """
+    from pathlib import Path as _Path
+
+    combined = new_data.lazy()
     if existing_path is not None and existing_path.exists():
-        existing = pl.read_parquet(existing_path)
-        combined = pl.concat([existing, new_data])
-    else:
-        combined = new_data
+        combined = pl.concat([pl.scan_parquet(existing_path), combined])
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".parquet", dir=output_path.parent)
+    os.close(fd)
+    tmp_path = _Path(tmp_name)
+    try:
+        deduplicate(combined).sink_parquet(
+            tmp_path, compression="zstd", row_group_size=_PARQUET_ROW_GROUP_SIZE
+        )
+        tmp_path.replace(output_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-    result = deduplicate(combined)
-    result.write_parquet(output_path)
-    logger.info("Wrote %d rows to %s", len(result), output_path)
-    return result
+    n_rows: int = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+    logger.info("Wrote %d rows to %s", n_rows, output_path)
+    return n_rows
 
 
 # ---------------------------------------------------------------------------
@@ -191,6 +279,7 @@ def ingest_from_archive_dir(
     *,
     parquet_path: Path | None = None,
     progress: bool = True,
+    workers: int | None = 1,
 ) -> pl.DataFrame:
     """Discover and ingest all ZIPs in *archive_dir*, skipping already-ingested.
 
@@ -203,6 +292,8 @@ def ingest_from_archive_dir(
         its ``zip_url`` column are skipped (incremental mode).
     progress:
         Emit ``logger.info`` messages about skip counts when ``True``.
+    workers:
+        Processes used to parse ZIPs; see :func:`ingest_from_zips`.
 
     Returns
     -------
@@ -234,7 +325,7 @@ def ingest_from_archive_dir(
         return pl.DataFrame(schema=COMPANIES_HOUSE_SCHEMA)
 
     logger.info("Processing %d ZIP file(s) from %s", len(pending), archive_dir)
-    return ingest_from_zips(pending)
+    return ingest_from_zips(pending, workers=workers)
 
 
 # ---------------------------------------------------------------------------
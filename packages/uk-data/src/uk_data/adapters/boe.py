@@ -27,14 +27,29 @@ See https://www.bankofengland.co.uk/legal for details.
 
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import platformdirs
+import polars as pl
 
 from uk_data.adapters.base import BaseAdapter
 from uk_data.models import point_timeseries, series_from_observations
-from uk_data.utils.http import get_text
+from uk_data.utils.http import get_text, retry
 from uk_data.utils.timeseries import filter_observations_by_date_window
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -54,8 +69,36 @@ _FALLBACK_HOUSEHOLD_RATE = 0.057  # Effective HH mortgage rate ~5.7%
 _FALLBACK_BUSINESS_RATE = 0.065  # Effective SME lending rate ~6.5%
 _FALLBACK_CAPITAL_RATIO = 0.148  # CET1 ratio ~14.8% (BoE FSR 2023)
 
+# Offline result of :func:`_fetch_lending_rates` (callers receive a copy).
+_FALLBACK_LENDING_RATES: dict[str, float] = {
+    "household_rate": _FALLBACK_HOUSEHOLD_RATE,
+    "business_rate": _FALLBACK_BUSINESS_RATE,
+    "bank_rate": _FALLBACK_BANK_RATE,
+    "household_spread": max(_FALLBACK_HOUSEHOLD_RATE - _FALLBACK_BANK_RATE, 0.0),
+    "business_spread": max(_FALLBACK_BUSINESS_RATE - _FALLBACK_BANK_RATE, 0.0),
+}
+
 
 _DEFAULT_IADB_FROM_YEAR = 2013
+_DEFAULT_IADB_FROM_DATE = f"01/Jan/{_DEFAULT_IADB_FROM_YEAR}"
+
+_IADB_URL_TMPL = (
+    _BOE_IADB + "?csv.x=yes&Datefrom={d}&SeriesCodes={s}&CSVF=TT&VPD=Y&VFD=N"
+)
+
+# (today, {years_back: "01/Jan/YYYY"}) — refreshed when the date changes.
+_today_cached: tuple[date, dict[int, str]] | None = None
+
+_IADB_FRAME_SCHEMA = {"date": pl.String, "value": pl.String}
+
+# Retry budget for IADB fetches.  Every BoE series has a published fallback,
+# so during an outage it is better to give up quickly than to back off for
+# seconds per series: one retry after 0.25 s.
+_BOE_RETRY_BUDGET: dict[str, Any] = {"retries": 1, "backoff": 0.25}
+
+# On-disk cache of IADB CSV bodies, reused for the rest of the calendar day.
+# Set ``UK_DATA_BOE_CACHE=0`` to disable (the test suites do).
+_CACHE_ENABLED_ENV = "UK_DATA_BOE_CACHE"
 
 
 def _year_from_bound(value: object) -> int | None:
@@ -92,6 +135,22 @@ def _year_from_bound(value: object) -> int | None:
     return None
 
 
+def _get_from_date(years_back: int) -> str:
+    """Return the IADB ``Datefrom`` value *years_back* years before this year.
+
+    Memoised per calendar day so URLs built with ``years_back`` stay
+    byte-identical within a day, keeping URL-keyed caches effective.
+    """
+    global _today_cached
+    today = date.today()
+    if _today_cached is None or _today_cached[0] != today:
+        _today_cached = (today, {})
+    dates = _today_cached[1]
+    if years_back not in dates:
+        dates[years_back] = f"01/Jan/{today.year - years_back}"
+    return dates[years_back]
+
+
 def _build_iadb_url(
     series: str,
     *,
@@ -113,59 +172,231 @@ def _build_iadb_url(
     Returns:
         Full URL string.
     """
-    if from_year is None:
-        if years_back is not None:
-            from_year = date.today().year - years_back
-        else:
-            from_year = _DEFAULT_IADB_FROM_YEAR
-    from_date = f"01/Jan/{from_year}"
-    url = (
-        f"{_BOE_IADB}"
-        f"?csv.x=yes"
-        f"&Datefrom={from_date}"
-        f"&SeriesCodes={series}"
-        f"&CSVF=TT"
-        f"&VPD=Y"
-        f"&VFD=N"
-    )
+    if from_year is not None:
+        from_date = f"01/Jan/{from_year}"
+    elif years_back is not None:
+        from_date = _get_from_date(years_back)
+    else:
+        from_date = _DEFAULT_IADB_FROM_DATE
+    url = _IADB_URL_TMPL.format(d=from_date, s=series)
     if to_year is not None:
         url += f"&Dateto=31/Dec/{to_year}"
     return url
 
 
-def _parse_iadb_csv(text: str) -> list[dict[str, str]]:
-    """Parse a BoE IADB CSV response into date/value pairs.
+@cache
+def _iadb_url(series: str) -> str:
+    """Return the default-range IADB URL for *series* (cached).
+
+    The default range starts at :data:`_DEFAULT_IADB_FROM_YEAR` and has no
+    end date, so the URL is fixed for the life of the process.
+    """
+    return _build_iadb_url(series)
+
+
+def _iadb_fields(line: str) -> tuple[str, str] | None:
+    """Return the stripped ``(date, value)`` fields of an IADB CSV line.
+
+    Data rows are ``date,value[,...]``; only the first two fields are split
+    off.  Returns ``None`` for lines that cannot be a data row (fewer than
+    two fields, or an empty date or value).
+    """
+    parts = line.split(",", 2)
+    if len(parts) < 2:
+        return None
+    date_part = parts[0].strip()
+    val_part = parts[1].strip()
+    if not (date_part and val_part):
+        return None
+    return date_part, val_part
+
+
+def _iter_iadb_rows(text: str) -> Iterator[tuple[str, str, float]]:
+    """Yield each data row of a BoE IADB CSV response.
 
     The IADB CSV format has a multi-line header section followed by
-    date-value rows of the form ``DD Mmm YYYY,value``.
+    date-value rows of the form ``DD Mmm YYYY,value``.  Header lines whose
+    value is not numeric are skipped; once data rows have started, the first
+    non-numeric row (trailing notes) ends the data block.
 
     Args:
         text: Raw IADB CSV text.
 
-    Returns:
-        List of ``{"date": str, "value": str}`` dicts.
+    Yields:
+        ``(date, value, parsed value)`` with the value both as published
+        and as a float.
     """
-    rows: list[dict[str, str]] = []
     in_data = False
     for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped:
+        fields = _iadb_fields(line)
+        if fields is None:
+            continue
+        try:
+            value = float(fields[1])
+        except ValueError:
+            if in_data:
+                return  # stop at trailing non-data
             continue
-        # Data rows start after a line that begins with a date-like pattern
-        parts = stripped.split(",")
-        if len(parts) >= 2:
-            # Simple heuristic: try to detect date-value rows
-            date_part = parts[0].strip()
-            val_part = parts[1].strip()
-            if date_part and val_part:
-                try:
-                    float(val_part)
-                    rows.append({"date": date_part, "value": val_part})
-                    in_data = True
-                except ValueError:
-                    if in_data:
-                        break  # stop at trailing non-data
-    return rows
+        in_data = True
+        yield fields[0], fields[1], value
+
+
+def _parse_iadb_csv(text: str) -> list[dict[str, str]]:
+    """Parse a BoE IADB CSV response into date/value pairs.
+
+    Args:
+        text: Raw IADB CSV text.
+
+    Returns:
+        List of ``{"date": str, "value": str}`` dicts.
+    """
+    return [
+        {"date": date_part, "value": val_part}
+        for date_part, val_part, _ in _iter_iadb_rows(text)
+    ]
+
+
+@dataclass(slots=True)
+class IADBSeries:
+    """A parsed IADB series held as parallel columns.
+
+    Attributes:
+        dates: Observation dates as published (``"DD Mmm YYYY"``).
+        values: Observation values as floats, aligned with *dates*.
+    """
+
+    dates: list[str] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _parse_iadb_series(text: str) -> IADBSeries:
+    """Parse a BoE IADB CSV response into an :class:`IADBSeries`.
+
+    Uses the rows of :func:`_iter_iadb_rows` but appends to two flat lists
+    instead of building a dict per row.
+
+    Args:
+        text: Raw IADB CSV text.
+
+    Returns:
+        The parsed series; empty when *text* has no data rows.
+    """
+    series = IADBSeries()
+    for date_part, _, value in _iter_iadb_rows(text):
+        series.dates.append(date_part)
+        series.values.append(value)
+    return series
+
+
+def _iadb_last_row(text: str) -> tuple[str, str, float] | None:
+    """Return the latest IADB row as ``(date, value, parsed value)``.
+
+    Keeps only the last row yielded by :func:`_iter_iadb_rows`, so no row
+    list is built.
+    """
+    tail = deque(_iter_iadb_rows(text), maxlen=1)
+    return tail[0] if tail else None
+
+
+def _parse_iadb_csv_last(text: str) -> tuple[str, str] | None:
+    """Return the most recent date/value pair from an IADB CSV response.
+
+    Equivalent to ``_parse_iadb_csv(text)[-1]`` without building the full
+    row list.
+
+    Args:
+        text: Raw IADB CSV text.
+
+    Returns:
+        ``(date, value)`` strings, or ``None`` when no data row is found.
+    """
+    last = _iadb_last_row(text)
+    return None if last is None else (last[0], last[1])
+
+
+def _parse_iadb_last_value(text: str) -> float | None:
+    """Return the most recent IADB value as a float, or ``None``.
+
+    For callers that only need the number, this avoids re-parsing the value
+    string that :func:`_parse_iadb_csv_last` has already validated.
+    """
+    last = _iadb_last_row(text)
+    return None if last is None else last[2]
+
+
+def _is_float(value: str) -> bool:
+    """Return whether *value* parses with :func:`float`."""
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _iadb_data_offset(text: str) -> int | None:
+    """Return the offset of the first date/value row in *text*, if any.
+
+    Uses the same row test as :func:`_iter_iadb_rows`; only the short header
+    block is scanned in Python.
+    """
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        fields = _iadb_fields(text[start:end])
+        if fields is not None and _is_float(fields[1]):
+            return start
+        start = end + 1
+    return None
+
+
+def _parse_iadb_frame(text: str) -> pl.DataFrame:
+    """Parse a BoE IADB CSV response into a two-column Polars frame.
+
+    Equivalent to :func:`_parse_iadb_csv` but the data rows are tokenised by
+    the native Polars CSV reader rather than a Python loop, which matters
+    for long daily series.  The header block is skipped by locating the
+    first ``date,value`` row.  Quotes carry no meaning in IADB bodies, so a
+    stray ``"`` in a trailing note is treated as plain text.
+
+    Args:
+        text: Raw IADB CSV text.
+
+    Returns:
+        DataFrame with string ``date`` and ``value`` columns (most-recent
+        last).  Empty when *text* contains no data rows.
+    """
+    offset = _iadb_data_offset(text)
+    if offset is None:
+        return pl.DataFrame(schema=_IADB_FRAME_SCHEMA)
+    frame = (
+        pl.read_csv(
+            io.StringIO(text[offset:]),
+            has_header=False,
+            quote_char=None,
+            columns=[0, 1],
+            infer_schema=False,
+            truncate_ragged_lines=True,
+        )
+        .select(
+            pl.nth(0).str.strip_chars().alias("date"),
+            pl.nth(1).str.strip_chars().alias("value"),
+        )
+        .filter((pl.col("date") != "") & (pl.col("value") != ""))
+    )
+    # Stop at the first non-numeric row (trailing notes), as _parse_iadb_csv
+    # does.  The Polars cast is stricter than float() (no "nan", "5_0"), so
+    # the few rows it rejects are re-checked in Python.
+    values = frame["value"]
+    rejected = values.cast(pl.Float64, strict=False).is_null().arg_true()
+    for idx in rejected:
+        if not _is_float(values[idx]):
+            return frame.head(idx)
+    return frame
 
 
 # ---------------------------------------------------------------------------
@@ -173,6 +404,60 @@ def _parse_iadb_csv(text: str) -> list[dict[str, str]]:
 # ---------------------------------------------------------------------------
 
 
+def _cache_enabled() -> bool:
+    """Return whether the on-disk IADB cache is enabled."""
+    return os.environ.get(_CACHE_ENABLED_ENV, "1") != "0"
+
+
+def _iadb_cache_dir() -> Path:
+    """Return the per-user directory holding cached IADB CSV bodies."""
+    return Path(platformdirs.user_cache_dir("companies_house_abm")) / "boe"
+
+
+def _iadb_cache_path(series: str, url: str) -> Path:
+    """Return the cache file for *url* today.
+
+    The URL digest distinguishes requests for the same series with different
+    date ranges; today's date bounds staleness to one calendar day.
+    """
+    digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return _iadb_cache_dir() / f"{series}-{digest}-{date.today().isoformat()}.csv"
+
+
+def _cached_fetch(series: str, url: str) -> str:
+    """Fetch an IADB CSV body, reusing today's on-disk copy when present.
+
+    Only bodies containing at least one data row are written, so an HTML
+    error or consent page served with HTTP 200 is never pinned for the day.
+    Network fetches use the :data:`_BOE_RETRY_BUDGET` retry budget.  Cache
+    read/write failures are logged and otherwise ignored.
+    """
+    if not _cache_enabled():
+        return retry(get_text, url, **_BOE_RETRY_BUDGET)
+    path = _iadb_cache_path(series, url)
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.debug("Could not read BoE cache file %s", path, exc_info=True)
+    text = retry(get_text, url, **_BOE_RETRY_BUDGET)
+    if _parse_iadb_csv_last(text) is None:
+        return text
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(text)
+        tmp.replace(path)
+        # Drop earlier days' copies of the same request.
+        for stale in path.parent.glob(path.name.rsplit("-", 3)[0] + "-*.csv"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        logger.debug("Could not write BoE cache file %s", path, exc_info=True)
+    return text
+
+
 def _fetch_bank_rate(
     num_observations: int | None = None,
     *,
@@ -193,16 +478,23 @@ def _fetch_bank_rate(
         to_year: Last calendar year of history to request (inclusive).
             Defaults to the current year when omitted.
     """
-    url = _build_iadb_url(_BANK_RATE_SERIES, from_year=from_year, to_year=to_year)
+    if from_year is None and to_year is None:
+        url = _iadb_url(_BANK_RATE_SERIES)
+    else:
+        url = _build_iadb_url(_BANK_RATE_SERIES, from_year=from_year, to_year=to_year)
     try:
-        text = get_text(url)
-        rows = _parse_iadb_csv(text)
+        text = _cached_fetch(_BANK_RATE_SERIES, url)
+        if num_observations == 1:
+            last = _parse_iadb_csv_last(text)
+            return [] if last is None else [{"date": last[0], "value": last[1]}]
+        frame = _parse_iadb_frame(text)
     except Exception:
         logger.warning("BoE IADB unavailable for Bank Rate; returning []")
         return []
-    if num_observations is not None and num_observations >= 0:
-        return rows[-num_observations:]
-    return rows
+    # Trim before materialising dicts; ``0`` keeps every row, as ``rows[-0:]``.
+    if num_observations is not None and num_observations > 0:
+        frame = frame.tail(num_observations)
+    return frame.to_dicts()
 
 
 def _fetch_bank_rate_current() -> float:
@@ -217,23 +509,52 @@ def _fetch_bank_rate_current() -> float:
     return _FALLBACK_BANK_RATE
 
 
-def _fetch_lending_rates() -> dict[str, float]:
-    """Fetch effective lending rates (internal helper)."""
-    bank_rate = _fetch_bank_rate_current()
+def _fetch_many(series: list[str]) -> dict[str, float | None]:
+    """Fetch the latest observation of several IADB series concurrently.
+
+    Each series is requested over the default date range in its own worker
+    thread, so the batch costs roughly one round-trip rather than one per
+    series.
 
-    def _fetch_rate(series: str, fallback: float) -> float:
-        url = _build_iadb_url(series)
+    Args:
+        series: BoE IADB series codes.
+
+    Returns:
+        Mapping of series code to its latest value (in percent, as
+        published), or ``None`` when the series could not be fetched or had
+        no data rows.
+    """
+
+    def _fetch_last(code: str) -> float | None:
         try:
-            text = get_text(url)
-            rows = _parse_iadb_csv(text)
-            if rows:
-                return float(rows[-1]["value"]) / 100.0
+            return _parse_iadb_last_value(_cached_fetch(code, _iadb_url(code)))
         except Exception:
-            pass
-        return fallback
+            logger.debug("BoE IADB unavailable for %s", code, exc_info=True)
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(series) or 1) as pool:
+        return dict(zip(series, pool.map(_fetch_last, series), strict=True))
+
+
+def _fetch_lending_rates() -> dict[str, float]:
+    """Fetch effective lending rates (internal helper).
+
+    Bank Rate and both lending series are fetched in a single concurrent
+    batch via :func:`_fetch_many`.
+    """
+    latest = _fetch_many(
+        [_BANK_RATE_SERIES, _HOUSEHOLD_LENDING_SERIES, _BUSINESS_LENDING_SERIES]
+    )
+    if all(value is None for value in latest.values()):
+        return dict(_FALLBACK_LENDING_RATES)
+
+    def _rate(series: str, fallback: float) -> float:
+        value = latest[series]
+        return fallback if value is None else value / 100.0
 
-    household_rate = _fetch_rate(_HOUSEHOLD_LENDING_SERIES, _FALLBACK_HOUSEHOLD_RATE)
-    business_rate = _fetch_rate(_BUSINESS_LENDING_SERIES, _FALLBACK_BUSINESS_RATE)
+    bank_rate = _rate(_BANK_RATE_SERIES, _FALLBACK_BANK_RATE)
+    household_rate = _rate(_HOUSEHOLD_LENDING_SERIES, _FALLBACK_HOUSEHOLD_RATE)
+    business_rate = _rate(_BUSINESS_LENDING_SERIES, _FALLBACK_BUSINESS_RATE)
 
     return {
         "household_rate": household_rate,
@@ -28,17 +28,19 @@ See https://resources.companieshouse.gov.uk/legal/termsAndConditions.shtml.
 
 from __future__ import annotations
 
-import io
 import logging
 import os
+import shutil
 import tempfile
 import urllib.error
 import urllib.request
 import zipfile
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import platformdirs
 import polars as pl
 
 from uk_data.adapters.base import BaseAdapter
@@ -50,6 +52,9 @@ from uk_data.transformers import EntityTransformer, EventTransformer
 from uk_data.utils.http import _USER_AGENT
 from uk_data.utils.timeseries import date_to_utc_datetime
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -72,6 +77,13 @@ _COL_SIC_1 = "SICCode.SicText_1"
 # the default 30 s used for small API responses.
 _DOWNLOAD_TIMEOUT = 600  # 10 minutes
 
+# Set to "0" to always download the bulk ZIP instead of reusing a cached copy.
+_BULK_CACHE_ENV = "UK_DATA_CH_BULK_CACHE"
+
+# Copy buffer for the bulk download; throughput plateaus between roughly
+# 100 KiB and 1 MiB, so larger buffers buy nothing.
+_DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 def _bulk_url(year: int, month: int) -> str:
     """Build the download URL for the given month."""
@@ -100,13 +112,15 @@ def _candidate_urls() -> list[str]:
 # ---------------------------------------------------------------------------
 
 
-def _stream_to_tempfile(url: str) -> str:
+def _stream_to_tempfile(url: str, directory: Path | None = None) -> str:
     """Stream *url* to a temporary file and return its path.
 
     The caller is responsible for deleting the file when done.
 
     Args:
         url: URL to download.
+        directory: Directory to create the file in; the system temporary
+            directory when ``None``.
 
     Returns:
         Path to the temporary file containing the downloaded bytes.
@@ -116,20 +130,15 @@ def _stream_to_tempfile(url: str) -> str:
     """
     logger.info("Downloading %s", url)
     req = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
-    fd, tmp_path_str = tempfile.mkstemp(suffix=".zip")
+    fd, tmp_path_str = tempfile.mkstemp(suffix=".zip", dir=directory)
     tmp_path = Path(tmp_path_str)
     try:
         with (
             urllib.request.urlopen(req, timeout=_DOWNLOAD_TIMEOUT) as resp,
             os.fdopen(fd, "wb") as tmp_file,
         ):
-            total = 0
-            while True:
-                chunk = resp.read(1024 * 1024)  # 1 MB chunks
-                if not chunk:
-                    break
-                tmp_file.write(chunk)
-                total += len(chunk)
+            shutil.copyfileobj(resp, tmp_file, length=_DOWNLOAD_CHUNK_SIZE)
+            total = tmp_file.tell()
         logger.info("Downloaded %.1f MB to %s", total / 1024 / 1024, tmp_path)
     except Exception:
         tmp_path.unlink(missing_ok=True)
@@ -138,22 +147,74 @@ def _stream_to_tempfile(url: str) -> str:
     return str(tmp_path)
 
 
+def _bulk_cache_enabled() -> bool:
+    """Return whether downloaded bulk ZIPs are cached on disk."""
+    return os.environ.get(_BULK_CACHE_ENV, "1") != "0"
+
+
+def _bulk_cache_dir() -> Path:
+    """Return the per-user directory holding cached bulk ZIPs."""
+    return Path(platformdirs.user_cache_dir("companies_house_abm")) / "companies_house"
+
+
+def _fetch_bulk_zip(url: str) -> tuple[str, bool]:
+    """Return a local copy of the bulk ZIP at *url*.
+
+    Each monthly snapshot has its own file name and never changes once
+    published, so a copy cached under that name is reused as-is.  A fresh
+    download is streamed into the cache directory and renamed into place,
+    so a partial download is never mistaken for a cached one.
+
+    Args:
+        url: Bulk-data URL from :func:`_candidate_urls`.
+
+    Returns:
+        ``(path, cached)``.  When *cached* is ``False`` the file is a
+        temporary download that the caller must delete.
+    """
+    if not _bulk_cache_enabled():
+        return _stream_to_tempfile(url), False
+
+    cache_dir = _bulk_cache_dir()
+    path = cache_dir / url.rsplit("/", 1)[-1]
+    if path.is_file() and path.stat().st_size > 0:
+        logger.info("Using cached bulk data %s", path)
+        return str(path), True
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        logger.debug("Could not create cache dir %s", cache_dir, exc_info=True)
+        return _stream_to_tempfile(url), False
+
+    tmp_path = Path(_stream_to_tempfile(url, cache_dir))
+    try:
+        tmp_path.replace(path)
+    except OSError:
+        logger.debug("Could not cache bulk data at %s", path, exc_info=True)
+        return str(tmp_path), False
+    return str(path), True
+
+
 # ---------------------------------------------------------------------------
 # Parsing
 # ---------------------------------------------------------------------------
 
 
-def _parse_bulk_zip(zip_path: str) -> pl.DataFrame:
-    """Parse the Companies House bulk ZIP file into a SIC lookup DataFrame.
+@contextmanager
+def _extracted_bulk_csv(zip_path: str) -> Iterator[Path]:
+    """Extract the CSV inside the bulk ZIP to a temporary directory.
 
-    Only the ``CompanyNumber`` and primary SIC code columns are extracted
-    to keep peak memory usage low.
+    The extracted file (several GB uncompressed) is removed on exit.
 
     Args:
         zip_path: Path to the downloaded ZIP file on disk.
 
-    Returns:
-        Raw DataFrame before normalisation.
+    Yields:
+        Path to the extracted CSV file.
+
+    Raises:
+        ValueError: If the archive contains no CSV file.
     """
     with zipfile.ZipFile(zip_path) as zf:
         csv_names = [n for n in zf.namelist() if n.lower().endswith(".csv")]
@@ -161,19 +222,74 @@ def _parse_bulk_zip(zip_path: str) -> pl.DataFrame:
             msg = f"No CSV file found inside {zip_path}"
             raise ValueError(msg)
         csv_name = csv_names[0]
-        logger.info("Parsing %s from ZIP", csv_name)
-        with zf.open(csv_name) as csv_file:
-            raw = csv_file.read()
+        with tempfile.TemporaryDirectory(prefix="ch_bulk_") as tmp_dir:
+            logger.info("Extracting %s from ZIP", csv_name)
+            yield Path(zf.extract(csv_name, tmp_dir))
 
-    return pl.read_csv(
-        io.BytesIO(raw),
-        columns=[_COL_COMPANY_NUMBER, _COL_SIC_1],
+
+def _scan_bulk_csv(csv_path: Path) -> pl.LazyFrame:
+    """Lazily scan the bulk CSV, projecting only the columns we need.
+
+    Projection pushdown means the other ~50 columns are never materialised.
+    """
+    return pl.scan_csv(
+        csv_path,
         schema_overrides={_COL_COMPANY_NUMBER: pl.Utf8, _COL_SIC_1: pl.Utf8},
         ignore_errors=True,
+    ).select(_COL_COMPANY_NUMBER, _COL_SIC_1)
+
+
+def _parse_bulk_zip(zip_path: str) -> pl.DataFrame:
+    """Parse the Companies House bulk ZIP file into a SIC lookup DataFrame.
+
+    Only the ``CompanyNumber`` and primary SIC code columns are extracted
+    to keep peak memory usage low: the CSV is extracted to disk and scanned
+    lazily rather than read into memory whole.
+
+    Args:
+        zip_path: Path to the downloaded ZIP file on disk.
+
+    Returns:
+        Raw DataFrame before normalisation.
+    """
+    with _extracted_bulk_csv(zip_path) as csv_path:
+        return _scan_bulk_csv(csv_path).collect(engine="streaming")
+
+
+def _normalise_lazy(raw: pl.LazyFrame) -> pl.LazyFrame:
+    """Build the lazy normalisation plan used by :func:`_normalise`.
+
+    Kept lazy so that it can be fused with :func:`_scan_bulk_csv` into a
+    single streamed query.
+    """
+    return (
+        raw.select(
+            pl.col(_COL_COMPANY_NUMBER)
+            .str.strip_chars()
+            .str.zfill(8)
+            .alias("companies_house_registered_number"),
+            # SIC entries look like "62020 - Description"; keep first 5 chars.
+            pl.col(_COL_SIC_1).str.strip_chars().str.slice(0, 5).alias("sic_code"),
+        )
+        # Nulls propagate through the string kernels above, so a single
+        # filter drops missing values along with malformed codes.  Retain
+        # only rows where sic_code is exactly 5 ASCII digits: an
+        # unsigned-integer cast rejects anything but digits (and "-"), and
+        # the only other character it accepts is a leading "+".  Leading
+        # zeros (e.g. "01110") are valid SIC codes and are kept.  Byte
+        # length equals character length for the ASCII codes that pass the
+        # cast, and avoids a UTF-8 decode.
+        .filter(
+            pl.col("companies_house_registered_number").is_not_null()
+            & (pl.col("sic_code").str.len_bytes() == 5)
+            & pl.col("sic_code").cast(pl.UInt32, strict=False).is_not_null()
+            & ~pl.col("sic_code").str.starts_with("+")
+        )
+        .unique(subset=["companies_house_registered_number"], keep="first")
     )
 
 
-def _normalise(raw: pl.DataFrame) -> pl.DataFrame:
+def _normalise(raw: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
     """Normalise raw bulk data into the SIC lookup format.
 
     Transformations applied:
@@ -188,33 +304,14 @@ def _normalise(raw: pl.DataFrame) -> pl.DataFrame:
     - Deduplicate to one row per company (keep first).
 
     Args:
-        raw: DataFrame as returned by :func:`_parse_bulk_zip`.
+        raw: Frame as returned by :func:`_parse_bulk_zip`, or the lazy scan
+            from :func:`_scan_bulk_csv`.
 
     Returns:
         Clean DataFrame with columns ``companies_house_registered_number``
         and ``sic_code``.
     """
-    result: pl.DataFrame = (
-        raw.lazy()
-        .filter(
-            pl.col(_COL_COMPANY_NUMBER).is_not_null() & pl.col(_COL_SIC_1).is_not_null()
-        )
-        .with_columns(
-            pl.col(_COL_COMPANY_NUMBER)
-            .str.strip_chars()
-            .str.zfill(8)
-            .alias("companies_house_registered_number"),
-            # SIC entries look like "62020 - Description"; keep first 5 chars.
-            pl.col(_COL_SIC_1).str.strip_chars().str.slice(0, 5).alias("sic_code"),
-        )
-        .select("companies_house_registered_number", "sic_code")
-        # Retain only rows where sic_code is exactly 5 ASCII digits.
-        .filter(pl.col("sic_code").str.len_chars() == 5)
-        .filter(pl.col("sic_code").str.contains(r"^\d{5}$"))
-        .unique(subset=["companies_house_registered_number"], keep="first")
-        .collect()
-    )
-    return result
+    return _normalise_lazy(raw.lazy()).collect(engine="streaming")
 
 
 # ---------------------------------------------------------------------------
@@ -229,7 +326,9 @@ def fetch_sic_codes(
     """Download Companies House bulk data and extract primary SIC codes.
 
     Tries the current month's snapshot first, then falls back to the
-    previous month if the current file is not yet published.
+    previous month if the current file is not yet published.  Downloaded
+    snapshots are cached in the user cache directory and reused on later
+    calls; set ``UK_DATA_CH_BULK_CACHE=0`` to always download.
 
     The resulting DataFrame has one row per company and can be passed
     directly to
@@ -261,26 +360,38 @@ def fetch_sic_codes(
     """
     last_exc: Exception | None = None
     for url in _candidate_urls():
-        tmp_path: str | None = None
+        zip_path: str | None = None
+        cached = False
         try:
-            tmp_path = _stream_to_tempfile(url)
-            raw = _parse_bulk_zip(tmp_path)
-            df = _normalise(raw)
+            zip_path, cached = _fetch_bulk_zip(url)
+            # Scan, project, normalise and deduplicate in one streamed query.
+            with _extracted_bulk_csv(zip_path) as csv_path:
+                lf = _normalise_lazy(_scan_bulk_csv(csv_path))
+                if output_path is None:
+                    df = lf.collect(engine="streaming")
+                else:
+                    # Stream straight to Parquet rather than materialising
+                    # the frame first, then read the compact result back.
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    lf.sink_parquet(
+                        output_path, compression="zstd", row_group_size=500_000
+                    )
+                    logger.info("SIC code lookup saved to %s", output_path)
+                    df = pl.read_parquet(output_path)
             logger.info("Extracted SIC codes for %d companies", len(df))
-            if output_path is not None:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                df.write_parquet(output_path)
-                logger.info("SIC code lookup saved to %s", output_path)
             return df
         except (urllib.error.URLError, TimeoutError, OSError) as exc:
             logger.warning("Could not fetch %s: %s", url, exc)
             last_exc = exc
+            cached = False
         except Exception as exc:
             logger.warning("Failed to parse bulk data from %s: %s", url, exc)
             last_exc = exc
+            # Do not keep a cached copy that cannot be parsed.
+            cached = False
         finally:
-            if tmp_path is not None:
-                Path(tmp_path).unlink(missing_ok=True)
+            if zip_path is not None and not cached:
+                Path(zip_path).unlink(missing_ok=True)
 
     raise RuntimeError(
         "Could not download Companies House bulk company data from any URL"
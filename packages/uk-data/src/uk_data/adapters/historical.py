@@ -29,7 +29,7 @@ from __future__ import annotations
 import json
 import logging
 import urllib.parse
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 from importlib import resources
 from typing import Any
@@ -38,7 +38,7 @@ from uk_data.adapters.boe import (
     _BANK_RATE_SERIES,
     _HOUSEHOLD_LENDING_SERIES,
     _build_iadb_url,
-    _parse_iadb_csv,
+    _parse_iadb_series,
 )
 from uk_data.utils.http import get_json, get_text
 
@@ -114,17 +114,24 @@ def _quarterly_last(
     end: str = "2024Q4",
 ) -> list[dict[str, float]]:
     """Aggregate BoE IADB rows to quarterly by taking the last value per quarter."""
-    by_quarter: dict[str, float] = {}
+    pairs: list[tuple[str, float]] = []
     for row in rows:
-        year, month = _parse_boe_date(row["date"])
-        label = _to_quarter_label(year, month)
-        if not label:
-            continue
         try:
-            by_quarter[label] = float(row["value"])
+            pairs.append((row["date"], float(row["value"])))
         except (ValueError, TypeError):
             continue
-    return _slice(by_quarter, start, end)
+    return _slice(_last_by_quarter(pairs), start, end)
+
+
+def _last_by_quarter(pairs: Iterable[tuple[str, float]]) -> dict[str, float]:
+    """Map BoE ``(date, value)`` pairs to the last value seen in each quarter."""
+    by_quarter: dict[str, float] = {}
+    for date_str, value in pairs:
+        year, month = _parse_boe_date(date_str)
+        label = _to_quarter_label(year, month)
+        if label:
+            by_quarter[label] = value
+    return by_quarter
 
 
 @lru_cache(maxsize=1)
@@ -150,9 +157,9 @@ def _iadb_quarterly_last(
     """Shared live-fetch for BoE IADB series that take the last value per quarter."""
     try:
         url = _build_iadb_url(series, from_year=2013)
-        text = get_text(url)
-        rows = _parse_iadb_csv(text)
-        return _quarterly_last(rows, start, end) or None
+        parsed = _parse_iadb_series(get_text(url))
+        by_quarter = _last_by_quarter(zip(parsed.dates, parsed.values, strict=True))
+        return _slice(by_quarter, start, end) or None
     except Exception:
         return None
 
@@ -231,19 +238,13 @@ def _fetch_earnings_index_live(start: str, end: str) -> list[dict[str, Any]] | N
 def _fetch_mortgage_approvals_live(start: str, end: str) -> list[dict[str, Any]] | None:
     try:
         url = _build_iadb_url(_MORTGAGE_APPROVALS_SERIES, from_year=2013)
-        text = get_text(url)
-        rows = _parse_iadb_csv(text)
+        parsed = _parse_iadb_series(get_text(url))
         by_quarter: dict[str, float] = {}
-        for row in rows:
-            year, month = _parse_boe_date(row["date"])
+        for date_str, val in zip(parsed.dates, parsed.values, strict=True):
+            year, month = _parse_boe_date(date_str)
             label = _to_quarter_label(year, month)
-            if not label:
-                continue
-            try:
-                val = float(row["value"])
-            except (ValueError, TypeError):
-                continue
-            by_quarter[label] = by_quarter.get(label, 0.0) + val
+            if label:
+                by_quarter[label] = by_quarter.get(label, 0.0) + val
         return [
             {"quarter": q, "value": int(by_quarter[q])}
             for q in QUARTERS
@@ -21,14 +21,20 @@ All information is reproduced under the Open Government Licence v3.0.
 from __future__ import annotations
 
 import json
+from bisect import bisect_right
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cache, lru_cache
 from importlib import resources
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
 
 from uk_data.adapters.base import BaseAdapter
 from uk_data.models import point_timeseries
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
 
 @dataclass(frozen=True)
 class IncomeTaxBand:
@@ -94,12 +100,18 @@ def get_income_tax_bands(tax_year: str = _DEFAULT_TAX_YEAR) -> list[IncomeTaxBan
         >>> bands[1].rate
         0.2
     """
+    return list(_income_tax_bands(tax_year))
+
+
+@cache
+def _income_tax_bands(tax_year: str) -> tuple[IncomeTaxBand, ...]:
+    """Build the (immutable) income tax bands for *tax_year* once."""
     entry = _year_entry(tax_year)
     pa = float(entry["personal_allowance"])
     higher = float(entry["higher_rate_threshold"])
     additional = float(entry["additional_rate_threshold"])
     rates = entry["income_tax_rates"]
-    return [
+    return (
         IncomeTaxBand(name="personal_allowance", lower=0.0, upper=pa, rate=0.0),
         IncomeTaxBand(name="basic", lower=pa, upper=higher, rate=float(rates["basic"])),
         IncomeTaxBand(
@@ -111,7 +123,7 @@ def get_income_tax_bands(tax_year: str = _DEFAULT_TAX_YEAR) -> list[IncomeTaxBan
             upper=None,
             rate=float(rates["additional"]),
         ),
-    ]
+    )
 
 
 def get_corporation_tax_rate(
@@ -138,48 +150,74 @@ def get_corporation_tax_rate(
     return small + (main - small) * (position / span)
 
 
+@cache
+def _income_tax_schedule(
+    tax_year: str,
+) -> tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...]]:
+    """Return ``(edges, rates, base)`` describing tax as a function of income.
+
+    Band thresholds are gross-income thresholds, and the band arithmetic
+    subtracts the same (possibly tapered) allowance from both taxable
+    income and the band edges, so the allowance cancels out.  The
+    liability is therefore piecewise linear in gross income:
+    ``base[k] + rates[k] * (gross - edges[k])`` for the band ``k`` whose
+    lower edge is the largest one not above *gross*.
+    """
+    bands = _income_tax_bands(tax_year)
+    edges = tuple(band.lower for band in bands)
+    rates = tuple(band.rate for band in bands)
+    base = [0.0]
+    for k in range(1, len(bands)):
+        base.append(base[-1] + rates[k - 1] * (edges[k] - edges[k - 1]))
+    return edges, rates, tuple(base)
+
+
 def compute_income_tax(
     gross_income: float,
     tax_year: str = _DEFAULT_TAX_YEAR,
 ) -> float:
     """Compute the annual income tax liability for a given gross income.
 
-    Applies the personal-allowance taper (1 GBP reduction per 2 GBP of
-    income above 100,000 GBP, removed entirely above 125,140 GBP).
+    Evaluated in closed form from the per-year band schedule, so each call
+    is one bisection and one multiply-add rather than a loop over bands.
     """
     if gross_income <= 0:
         return 0.0
 
-    entry = _year_entry(tax_year)
-    pa = float(entry["personal_allowance"])
-    bands = get_income_tax_bands(tax_year)
-
-    taper_start = 100_000.0
-    allowance = pa
-    if gross_income > taper_start:
-        reduction = min((gross_income - taper_start) / 2.0, allowance)
-        allowance = max(allowance - reduction, 0.0)
-
-    taxable = max(gross_income - allowance, 0.0)
-    tax = 0.0
-    for band in bands:
-        if band.rate == 0.0:
-            continue
-        band_lower = max(band.lower - allowance, 0.0)
-        band_upper = (band.upper - allowance) if band.upper is not None else None
-        if band_upper is not None:
-            band_income = max(min(taxable, band_upper) - band_lower, 0.0)
-        else:
-            band_income = max(taxable - band_lower, 0.0)
-        tax += band_income * band.rate
-
-    return tax
+    edges, rates, base = _income_tax_schedule(tax_year)
+    k = bisect_right(edges, gross_income) - 1
+    return base[k] + rates[k] * (gross_income - edges[k])
 
 
+def compute_income_tax_array(
+    gross_income: ArrayLike,
+    tax_year: str = _DEFAULT_TAX_YEAR,
+) -> NDArray[np.float64]:
+    """Vectorised :func:`compute_income_tax` over an array of gross incomes.
+
+    A whole population of agents can be taxed in one call instead of one
+    Python call each.
+
+    Example::
+
+        >>> from uk_data.adapters.hmrc import compute_income_tax_array
+        >>> compute_income_tax_array([0.0, 30_000.0]).tolist()
+        [0.0, 3486.0]
+    """
+    edges, rates, base = (np.asarray(t) for t in _income_tax_schedule(tax_year))
+    gross = np.maximum(np.asarray(gross_income, dtype=np.float64), 0.0)
+    k = np.searchsorted(edges, gross, side="right") - 1
+    return base[k] + rates[k] * (gross - edges[k])
+
+
+@cache
 def get_national_insurance_rates(
     tax_year: str = _DEFAULT_TAX_YEAR,
 ) -> NationalInsuranceRates:
-    """Return UK National Insurance contribution rates for *tax_year*."""
+    """Return UK National Insurance contribution rates for *tax_year*.
+
+    The result is frozen, so the same instance is returned on every call.
+    """
     ni = _year_entry(tax_year)["national_insurance"]
     return NationalInsuranceRates(
         employee_main_rate=float(ni["employee_main_rate"]),
@@ -247,6 +285,49 @@ def effective_tax_wedge(
     }
 
 
+def effective_tax_wedge_array(
+    gross_salary: ArrayLike,
+    tax_year: str = _DEFAULT_TAX_YEAR,
+) -> dict[str, NDArray[np.float64]]:
+    """Vectorised :func:`effective_tax_wedge` over an array of salaries.
+
+    Returns the same keys as :func:`effective_tax_wedge`, each mapped to an
+    array aligned with *gross_salary*.
+    """
+    gross = np.asarray(gross_salary, dtype=np.float64)
+    ni = get_national_insurance_rates(tax_year)
+    income_tax = compute_income_tax_array(gross, tax_year)
+    employer_ni = np.maximum(gross - ni.secondary_threshold, 0.0) * ni.employer_rate
+
+    main_band = np.maximum(
+        np.minimum(gross, ni.upper_earnings_limit) - ni.primary_threshold, 0.0
+    )
+    upper_band = np.maximum(gross - ni.upper_earnings_limit, 0.0)
+    employee_ni = (
+        main_band * ni.employee_main_rate + upper_band * ni.employee_upper_rate
+    )
+
+    total_labour_cost = gross + employer_ni
+    total_tax = income_tax + employee_ni + employer_ni
+    positive = total_labour_cost > 0
+    effective_rate = np.divide(
+        total_tax,
+        total_labour_cost,
+        out=np.zeros_like(total_tax),
+        where=positive,
+    )
+
+    return {
+        "gross_salary": gross,
+        "income_tax": income_tax,
+        "employee_ni": employee_ni,
+        "employer_ni": employer_ni,
+        "total_labour_cost": total_labour_cost,
+        "effective_rate": effective_rate,
+        "take_home": gross - income_tax - employee_ni,
+    }
+
+
 class HMRCAdapter(BaseAdapter):
     """Canonical adapter for static HMRC tax parameters.
 
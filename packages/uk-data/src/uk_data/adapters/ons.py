@@ -24,6 +24,7 @@ See https://www.ons.gov.uk/methodology/geography/licences for details.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote, urlencode
@@ -227,7 +228,9 @@ def _fetch_timeseries(series_id: str, limit: int = 20) -> list[dict[str, Any]]:
         or data.get("observations")
         or []
     )
-    return observations[-limit:] if len(observations) > limit else observations
+    # Always slice: the parsed document is shared via get_json's cache, so
+    # callers must get a fresh list they can mutate.
+    return observations[-limit:]
 
 
 def _latest_float(series_id: str) -> float | None:
@@ -248,6 +251,25 @@ def _latest_float(series_id: str) -> float | None:
         return None
 
 
+def _latest_floats(series_ids: list[str]) -> dict[str, float | None]:
+    """Return the latest value of several ONS series, fetched concurrently.
+
+    Each series is requested in its own worker thread via
+    :func:`_latest_float`, so the batch costs roughly one round-trip rather
+    than one per series.  The shared HTTP cache and client pool are
+    lock-guarded, so concurrent callers are safe.
+
+    Args:
+        series_ids: ONS time-series identifiers.
+
+    Returns:
+        Mapping of series identifier to its latest value, or ``None`` when
+        the series is unavailable.
+    """
+    with ThreadPoolExecutor(max_workers=len(series_ids) or 1) as pool:
+        return dict(zip(series_ids, pool.map(_latest_float, series_ids), strict=True))
+
+
 # ---------------------------------------------------------------------------
 # Public fetch functions
 # ---------------------------------------------------------------------------
@@ -15,6 +15,7 @@ from uk_data.transformers.timeseries import point_timeseries, series_from_observ
 from uk_data.utils.http import (
     _USER_AGENT,
     clear_cache,
+    close_clients,
     encode_basic_auth,
     get_bytes,
     get_json,
@@ -27,6 +28,7 @@ from uk_data.utils.timeseries import date_to_utc_datetime
 __all__ = [
     "_USER_AGENT",
     "clear_cache",
+    "close_clients",
     "date_to_utc_datetime",
     "encode_basic_auth",
     "get_bytes",
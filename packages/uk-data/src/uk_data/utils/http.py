@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
 import threading
 import time
@@ -23,6 +24,12 @@ _CACHE_MAX_ENTRIES = 256
 _CACHE: OrderedDict[str, Any] = OrderedDict()
 _CACHE_LOCK = threading.Lock()
 
+# One pooled keep-alive client per timeout, shared across threads so repeated
+# requests to the same host reuse TCP/TLS connections.
+_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+_CLIENTS: dict[int, httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+
 T = TypeVar("T")
 
 
@@ -47,12 +54,30 @@ def clear_cache() -> None:
 
 
 def _get_client(*, timeout: int = _DEFAULT_TIMEOUT) -> httpx.Client:
-    """Return a configured httpx client. Separate function to allow test patching."""
-    return httpx.Client(
-        timeout=timeout,
-        follow_redirects=True,
-        headers={"User-Agent": _USER_AGENT},
-    )
+    """Return the shared httpx client for *timeout*.
+
+    Separate function to allow test patching.
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(timeout)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                timeout=timeout,
+                follow_redirects=True,
+                headers={"User-Agent": _USER_AGENT},
+                limits=_POOL_LIMITS,
+            )
+            _CLIENTS[timeout] = client
+        return client
+
+
+@atexit.register
+def close_clients() -> None:
+    """Close the shared HTTP clients and their pooled connections."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
 
 
 def retry(
@@ -21,7 +21,7 @@ from uk_data.adapters.ons import (
     _fetch_affordability_ratio,
     _fetch_rental_growth,
     _fetch_timeseries,
-    _latest_float,
+    _latest_floats,
 )
 
 logger = logging.getLogger(__name__)
@@ -109,11 +109,13 @@ def fetch_labour_market() -> dict[str, float | None]:
         - ``"unemployment_rate"`` — LFS unemployment rate (%, SA).
         - ``"average_weekly_earnings"`` — Average weekly earnings (GBP, SA).
 
-        Values are ``None`` if the ONS API is unreachable.
+        Values are ``None`` if the ONS API is unreachable.  Both series
+        are fetched concurrently.
     """
+    latest = _latest_floats([_UNEMPLOYMENT_RATE_SERIES, _AVERAGE_EARNINGS_SERIES])
     return {
-        "unemployment_rate": _latest_float(_UNEMPLOYMENT_RATE_SERIES),
-        "average_weekly_earnings": _latest_float(_AVERAGE_EARNINGS_SERIES),
+        "unemployment_rate": latest[_UNEMPLOYMENT_RATE_SERIES],
+        "average_weekly_earnings": latest[_AVERAGE_EARNINGS_SERIES],
     }
 
 
@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+from datetime import date
+from pathlib import Path
 from unittest.mock import patch
 
+import platformdirs
 import pytest
 
-from uk_data.adapters.boe import BoEAdapter
+from uk_data.adapters.boe import (
+    BoEAdapter,
+    _build_iadb_url,
+    _cached_fetch,
+    _fetch_bank_rate,
+    _fetch_lending_rates,
+    _iadb_cache_dir,
+    _iter_iadb_rows,
+    _parse_iadb_csv,
+    _parse_iadb_csv_last,
+    _parse_iadb_frame,
+    _parse_iadb_last_value,
+    _parse_iadb_series,
+)
 
 
 class TestBoEAdapterAvailableSeries:
@@ -151,3 +167,252 @@ class TestBoEAdapterFetchSeries:
             from_year=2024,
             to_year=2024,
         )
+
+
+class TestParseIadbFrame:
+    def test_matches_python_parser(self) -> None:
+        text = (
+            "Title,IUMABEDR\n"
+            "Units,1 percent\n"
+            "\n"
+            "01 Jan 2024, 5.25 \n"
+            "\n"
+            "02 Jan 2024,5.00\n"
+            "Notes,see website\n"
+            "03 Jan 2024,4.75\n"
+        )
+        frame = _parse_iadb_frame(text)
+        assert frame.to_dicts() == _parse_iadb_csv(text)
+        assert frame["value"].to_list() == ["5.25", "5.00"]
+
+    def test_ignores_extra_series_columns(self) -> None:
+        text = "DATE,IUMABEDR,IUMTLMV\n01 Jan 2024,5.25,6.10\n01 Feb 2024,5.25,6.05\n"
+        frame = _parse_iadb_frame(text)
+        assert frame.columns == ["date", "value"]
+        assert frame["value"].to_list() == ["5.25", "5.25"]
+
+    def test_html_error_page_returns_empty_frame(self) -> None:
+        frame = _parse_iadb_frame("<html><body>Access denied.</body></html>")
+        assert frame.is_empty()
+        assert frame.columns == ["date", "value"]
+
+    def test_fetch_bank_rate_trims_before_materialising(self) -> None:
+        text = "".join(f"{d:02d} Jan 2024,{d}.00\n" for d in range(1, 29))
+        with patch("uk_data.adapters.boe.get_text", return_value=text):
+            rows = _fetch_bank_rate(3)
+        assert rows == [
+            {"date": "26 Jan 2024", "value": "26.00"},
+            {"date": "27 Jan 2024", "value": "27.00"},
+            {"date": "28 Jan 2024", "value": "28.00"},
+        ]
+
+    def test_stray_quote_in_trailing_note(self) -> None:
+        text = '01 Jan 2024,5.25\n02 Jan 2024,5.00\n"Source: BoE, note\n'
+        assert _parse_iadb_frame(text).to_dicts() == _parse_iadb_csv(text)
+        with patch("uk_data.adapters.boe.get_text", return_value=text):
+            assert len(_fetch_bank_rate(5)) == 2
+
+    def test_accepts_same_numeric_grammar_as_float(self) -> None:
+        text = "Units,%\n01 Jan 2024,nan\n02 Jan 2024,5_0\n03 Jan 2024,n/a\n"
+        frame = _parse_iadb_frame(text)
+        assert frame.to_dicts() == _parse_iadb_csv(text)
+        assert frame["value"].to_list() == ["nan", "5_0"]
+
+
+class TestParseIadbCsvLast:
+    def test_returns_latest_row(self) -> None:
+        text = "Title,IUMABEDR\n\n01 Jan 2024,5.25\n01 Feb 2024,5.00\r\n\n"
+        assert _parse_iadb_csv_last(text) == ("01 Feb 2024", "5.00")
+        assert _parse_iadb_csv_last(text) == tuple(_parse_iadb_csv(text)[-1].values())
+
+    def test_skips_trailing_notes(self) -> None:
+        text = "01 Jan 2024,5.25\n01 Feb 2024,5.00\nNotes,see website\n"
+        assert _parse_iadb_csv_last(text) == ("01 Feb 2024", "5.00")
+
+    def test_last_value_is_parsed_float(self) -> None:
+        text = "01 Jan 2024,5.25\n01 Feb 2024,5.00\nNotes,see website\n"
+        assert _parse_iadb_last_value(text) == 5.0
+        assert _parse_iadb_last_value("<html></html>") is None
+
+    def test_stops_at_first_non_numeric_row_after_data(self) -> None:
+        text = "T,X\n01 Jan 2024,5.25\nNotes,see\n02 Jan 2024,4.75\n"
+        expected = _parse_iadb_csv(text)[-1]
+        assert _parse_iadb_csv_last(text) == (expected["date"], expected["value"])
+        with patch("uk_data.adapters.boe.get_text", return_value=text):
+            assert _fetch_bank_rate(1) == _fetch_bank_rate(2)[-1:]
+
+    def test_returns_none_without_data(self) -> None:
+        assert _parse_iadb_csv_last("<html>Access denied.</html>") is None
+        assert _parse_iadb_csv_last("") is None
+
+    def test_fetch_bank_rate_single_observation_uses_tail(self) -> None:
+        text = "Title,IUMABEDR\n01 Jan 2024,5.25\n01 Feb 2024,5.00\n"
+        with patch("uk_data.adapters.boe.get_text", return_value=text):
+            rows = _fetch_bank_rate(1)
+        assert rows == [{"date": "01 Feb 2024", "value": "5.00"}]
+
+
+class TestIadbDiskCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setenv("UK_DATA_BOE_CACHE", "1")
+        monkeypatch.setattr(
+            "uk_data.adapters.boe._iadb_cache_dir", lambda: tmp_path / "boe"
+        )
+        return tmp_path / "boe"
+
+    def test_default_dir_is_platform_user_cache(self) -> None:
+        assert _iadb_cache_dir().parent == Path(
+            platformdirs.user_cache_dir("companies_house_abm")
+        )
+
+    def test_second_fetch_reads_from_disk(self, cache_dir: Path) -> None:
+        body = "01 Jan 2024,5.25\n"
+        with patch("uk_data.adapters.boe.get_text", return_value=body) as get:
+            assert _cached_fetch("IUMABEDR", "https://example/a") == body
+            assert _cached_fetch("IUMABEDR", "https://example/a") == body
+        get.assert_called_once()
+        assert len(list(cache_dir.glob("*.csv"))) == 1
+
+    @pytest.mark.usefixtures("cache_dir")
+    def test_distinct_urls_do_not_collide(self) -> None:
+        bodies = ["01 Jan 2024,1\n", "01 Jan 2024,2\n"]
+        with patch("uk_data.adapters.boe.get_text", side_effect=bodies):
+            assert _cached_fetch("IUMABEDR", "https://example/a") == bodies[0]
+            assert _cached_fetch("IUMABEDR", "https://example/b") == bodies[1]
+
+    def test_body_without_data_is_not_cached(self, cache_dir: Path) -> None:
+        html = "<html><body>Please accept cookies.</body></html>"
+        with patch("uk_data.adapters.boe.get_text", return_value=html) as get:
+            _cached_fetch("IUMABEDR", "https://example/a")
+            _cached_fetch("IUMABEDR", "https://example/a")
+        assert get.call_count == 2
+        assert not cache_dir.exists()
+
+    def test_failed_fetch_is_not_cached(self, cache_dir: Path) -> None:
+        with (
+            patch("uk_data.adapters.boe.get_text", side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
+            _cached_fetch("IUMABEDR", "https://example/a")
+        assert not cache_dir.exists()
+
+    @pytest.mark.usefixtures("cache_dir")
+    def test_transient_failure_is_retried_once(self) -> None:
+        body = "01 Jan 2024,5.25\n"
+        with (
+            patch(
+                "uk_data.adapters.boe.get_text",
+                side_effect=[RuntimeError("blip"), body, RuntimeError("down")],
+            ) as get,
+            patch("uk_data.utils.http.time.sleep") as sleep,
+        ):
+            assert _cached_fetch("IUMABEDR", "https://example/a") == body
+        assert get.call_count == 2
+        sleep.assert_called_once_with(0.25)
+
+    @pytest.mark.usefixtures("cache_dir")
+    def test_disabled_cache_always_fetches(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("UK_DATA_BOE_CACHE", "0")
+        body = "01 Jan 2024,5.25\n"
+        with patch("uk_data.adapters.boe.get_text", return_value=body) as get:
+            _cached_fetch("IUMABEDR", "https://example/a")
+            _cached_fetch("IUMABEDR", "https://example/a")
+        assert get.call_count == 2
+
+
+class TestBuildIadbUrl:
+    def test_default_url_is_stable(self) -> None:
+        assert _build_iadb_url("IUMABEDR") == (
+            "https://www.bankofengland.co.uk/boeapps/database/"
+            "_iadb-FromShowColumns.asp?csv.x=yes&Datefrom=01/Jan/2013"
+            "&SeriesCodes=IUMABEDR&CSVF=TT&VPD=Y&VFD=N"
+        )
+
+    def test_to_year_appends_dateto(self) -> None:
+        url = _build_iadb_url("IUMABEDR", from_year=2020, to_year=2021)
+        assert "Datefrom=01/Jan/2020" in url
+        assert url.endswith("&Dateto=31/Dec/2021")
+
+    def test_years_back_refreshes_on_day_change(self) -> None:
+        class _Date(date):
+            current = date(2024, 12, 31)
+
+            @classmethod
+            def today(cls) -> date:
+                return cls.current
+
+        with patch("uk_data.adapters.boe.date", _Date):
+            assert "Datefrom=01/Jan/2019" in _build_iadb_url("X", years_back=5)
+            _Date.current = date(2025, 1, 1)
+            assert "Datefrom=01/Jan/2020" in _build_iadb_url("X", years_back=5)
+
+
+class TestFetchLendingRates:
+    def test_bank_rate_comes_from_the_same_batch(self) -> None:
+        bodies = {
+            "IUMABEDR": "01 Jan 2024,5.25\n",
+            "IUMTLMV": "01 Jan 2024,5.75\n",
+            "IUMZICQ": "01 Jan 2024,6.50\n",
+        }
+
+        def _get_text(url: str) -> str:
+            return next(body for code, body in bodies.items() if code in url)
+
+        with (
+            patch("uk_data.adapters.boe.get_text", side_effect=_get_text) as get,
+            patch("uk_data.adapters.boe._fetch_bank_rate") as bank_rate,
+        ):
+            rates = _fetch_lending_rates()
+        assert get.call_count == 3
+        bank_rate.assert_not_called()
+        assert rates["bank_rate"] == pytest.approx(0.0525)
+        assert rates["household_spread"] == pytest.approx(0.005)
+        assert rates["business_spread"] == pytest.approx(0.0125)
+
+    def test_offline_returns_copy_of_fallback(self) -> None:
+        with patch("uk_data.adapters.boe.get_text", side_effect=RuntimeError):
+            rates = _fetch_lending_rates()
+            rates["bank_rate"] = 0.0
+            again = _fetch_lending_rates()
+        assert again["bank_rate"] == pytest.approx(0.0475)
+        assert again["household_spread"] == pytest.approx(0.057 - 0.0475)
+        assert again["business_spread"] == pytest.approx(0.065 - 0.0475)
+
+    def test_failed_series_fall_back_independently(self) -> None:
+        def _get_text(url: str) -> str:
+            if "IUMTLMV" in url:
+                return "01 Jan 2024,5.75\n"
+            raise RuntimeError("no network")
+
+        with patch("uk_data.adapters.boe.get_text", side_effect=_get_text):
+            rates = _fetch_lending_rates()
+        assert rates["household_rate"] == pytest.approx(0.0575)
+        assert rates["bank_rate"] == pytest.approx(0.0475)
+        assert rates["business_rate"] == pytest.approx(0.065)
+
+
+class TestIterIadbRows:
+    def test_skips_header_and_stops_at_trailing_notes(self) -> None:
+        text = (
+            "T,X\n01 Jan 2024,5.25\n,\n02 Jan 2024, 4.75 ,x\nNotes,see\n03 Jan 2024,4\n"
+        )
+        assert list(_iter_iadb_rows(text)) == [
+            ("01 Jan 2024", "5.25", 5.25),
+            ("02 Jan 2024", "4.75", 4.75),
+        ]
+
+
+class TestParseIadbSeries:
+    def test_matches_row_parser(self) -> None:
+        text = "T,X\n01 Jan 2024,5.25\n02 Jan 2024, 4.75 ,x\nNotes,see\n03 Jan 2024,4\n"
+        series = _parse_iadb_series(text)
+        rows = _parse_iadb_csv(text)
+        assert series.dates == [row["date"] for row in rows]
+        assert series.values == [float(row["value"]) for row in rows]
+        assert len(series) == 2
+
+    def test_empty_for_html(self) -> None:
+        assert len(_parse_iadb_series("<html>Access denied</html>")) == 0
@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from uk_data.adapters.ons import ONSAdapter
+from uk_data.adapters.ons import ONSAdapter, _fetch_timeseries
 from uk_data.adapters.ons_models import (
     Observation,
     ObservationDimensions,
@@ -30,6 +30,20 @@ def _make_ons_observation(rows: list[dict[str, str]]) -> ONSObservation:
     )
 
 
+class TestFetchTimeseries:
+    def test_returns_last_limit_observations(self) -> None:
+        payload = {"quarters": [{"date": str(i), "value": str(i)} for i in range(5)]}
+        with patch("uk_data.adapters.ons.get_json", return_value=payload):
+            obs = _fetch_timeseries("ABMI", limit=2)
+        assert [o["date"] for o in obs] == ["3", "4"]
+
+    def test_result_does_not_alias_cached_payload(self) -> None:
+        payload = {"quarters": [{"date": "2024 Q1", "value": "1"}]}
+        with patch("uk_data.adapters.ons.get_json", return_value=payload):
+            _fetch_timeseries("ABMI", limit=20).clear()
+        assert len(payload["quarters"]) == 1
+
+
 class TestONSAdapterAvailableSeries:
     def test_returns_seven_series(self) -> None:
         adapter = ONSAdapter()
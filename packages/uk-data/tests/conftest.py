@@ -21,6 +21,18 @@ def _clear_http_cache() -> Iterator[None]:
     clear_cache()
 
 
+@pytest.fixture(autouse=True)
+def _disable_boe_disk_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep BoE fetches deterministic by bypassing the on-disk CSV cache."""
+    monkeypatch.setenv("UK_DATA_BOE_CACHE", "0")
+
+
+@pytest.fixture(autouse=True)
+def _disable_bulk_zip_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep mocked Companies House bulk downloads out of the user cache."""
+    monkeypatch.setenv("UK_DATA_CH_BULK_CACHE", "0")
+
+
 @pytest.fixture
 def skip_if_cannot_reach():
     """Return a helper that skips the current test if a URL is unreachable."""
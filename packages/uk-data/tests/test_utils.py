@@ -21,6 +21,7 @@ from uk_data.utils import (
     get_text,
     retry,
 )
+from uk_data.utils.http import _get_client, close_clients
 from uk_data.utils.timeseries import _parse_timestamp
 
 # ---------------------------------------------------------------------------
@@ -110,6 +111,21 @@ class TestGetBytes:
         assert result == raw
 
 
+class TestGetClient:
+    def teardown_method(self) -> None:
+        close_clients()
+
+    def test_reuses_client_per_timeout(self) -> None:
+        assert _get_client() is _get_client()
+        assert _get_client(timeout=5) is not _get_client()
+
+    def test_replaces_closed_client(self) -> None:
+        client = _get_client()
+        close_clients()
+        assert client.is_closed
+        assert _get_client() is not client
+
+
 class TestRetry:
     def test_succeeds_on_first_attempt(self) -> None:
         calls = []
@@ -61,6 +61,18 @@ def reset_typer_force_terminal() -> Generator[None]:
         ru.FORCE_TERMINAL = old  # type: ignore[attr-defined]
 
 
+@pytest.fixture(autouse=True)
+def disable_boe_disk_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Bypass the on-disk BoE CSV cache so mocked fetches stay deterministic."""
+    monkeypatch.setenv("UK_DATA_BOE_CACHE", "0")
+
+
+@pytest.fixture(autouse=True)
+def disable_bulk_zip_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep mocked Companies House bulk downloads out of the user cache."""
+    monkeypatch.setenv("UK_DATA_CH_BULK_CACHE", "0")
+
+
 @pytest.fixture
 def sample_data() -> dict[str, str]:
     """Provide sample data for tests."""
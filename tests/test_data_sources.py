@@ -10,6 +10,7 @@ import csv
 import io as _io
 import urllib.error
 import zipfile as _zf
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
@@ -30,16 +31,20 @@ from companies_house_abm.data_sources.calibration import (
     calibrate_households,
     calibrate_io_sectors,
     calibrate_model,
+    clear_io_sectors_cache,
 )
 from companies_house_abm.data_sources.input_output import fetch_input_output_table
 from uk_data.adapters.companies_house import (
     _normalise,
     _parse_bulk_zip,
+    _stream_to_tempfile,
     fetch_sic_codes,
 )
 from uk_data.adapters.hmrc import (
     compute_income_tax,
+    compute_income_tax_array,
     effective_tax_wedge,
+    effective_tax_wedge_array,
     get_corporation_tax_rate,
     get_income_tax_bands,
     get_national_insurance_rates,
@@ -107,6 +112,18 @@ class TestHmrcIncomeTaxBands:
             get_income_tax_bands("2020/21")
 
 
+class TestHmrcCaching:
+    def test_income_tax_bands_are_fresh_lists(self) -> None:
+
+        first = get_income_tax_bands()
+        first.clear()
+        assert len(get_income_tax_bands()) == 4
+
+    def test_national_insurance_rates_are_reused(self) -> None:
+
+        assert get_national_insurance_rates() is get_national_insurance_rates()
+
+
 class TestHmrcComputeIncomeTax:
     def test_zero_income_gives_zero_tax(self) -> None:
 
@@ -139,6 +156,13 @@ class TestHmrcComputeIncomeTax:
 
         assert compute_income_tax(-5_000) == pytest.approx(0.0)
 
+    def test_array_matches_scalar(self) -> None:
+
+        incomes = [-5_000, 0, 12_570, 30_000, 50_270, 100_000, 110_000, 125_140]
+        incomes.append(250_000)
+        expected = [compute_income_tax(inc) for inc in incomes]
+        assert compute_income_tax_array(incomes).tolist() == pytest.approx(expected)
+
 
 class TestHmrcCorporationTax:
     def test_small_profits_rate(self) -> None:
@@ -222,6 +246,15 @@ class TestHmrcEffectiveTaxWedge:
         assert wedge["income_tax"] == pytest.approx(0.0)
         assert wedge["effective_rate"] == pytest.approx(0.0)
 
+    def test_array_matches_scalar(self) -> None:
+
+        salaries = [0, 9_000, 12_570, 35_000, 50_270, 80_000, 150_000]
+        wedges = effective_tax_wedge_array(salaries)
+        for i, salary in enumerate(salaries):
+            expected = effective_tax_wedge(salary)
+            for key, value in expected.items():
+                assert wedges[key][i] == pytest.approx(value), key
+
 
 # ---------------------------------------------------------------------------
 # Bank of England tests (mocked HTTP)
@@ -418,6 +451,16 @@ class TestOnsLabourMarket:
         assert data["unemployment_rate"] is None
         assert data["average_weekly_earnings"] is None
 
+    def test_concurrent_fetch_keeps_series_mapping(self) -> None:
+        values = {"MGSX": "4.2", "KAB9": "690"}
+
+        with patch(
+            "uk_data.adapters.ons._fetch_timeseries",
+            side_effect=lambda sid, **_: [{"date": "2024", "value": values[sid]}],
+        ):
+            data = fetch_labour_market()
+        assert data == {"unemployment_rate": 4.2, "average_weekly_earnings": 690.0}
+
 
 class TestOnsInputOutputTable:
     def test_returns_expected_keys(self) -> None:
@@ -548,6 +591,8 @@ class TestCalibrateHouseholds:
         # Without API, should return same defaults
         assert cfg.count == default.count
         assert cfg.income_distribution == default.income_distribution
+        # No overrides apply, so the input instance is returned as-is
+        assert cfg is default
 
     def test_updates_mpc_from_savings_ratio(self) -> None:
 
@@ -633,6 +678,10 @@ class TestCalibrateGovernment:
 
 
 class TestCalibrateIoSectors:
+    @pytest.fixture(autouse=True)
+    def clear_io_cache(self) -> None:
+        clear_io_sectors_cache()
+
     def test_returns_expected_keys(self) -> None:
         with (
             patch(
@@ -668,6 +717,36 @@ class TestCalibrateIoSectors:
         for sector, mult in data["output_multipliers"].items():
             assert mult >= 1.0, f"Multiplier for {sector} is {mult} < 1"
 
+    def test_result_is_cached_and_copied(self) -> None:
+
+        with patch(
+            "companies_house_abm.data_sources.calibration.fetch_input_output_table",
+            wraps=fetch_input_output_table,
+        ) as fetch:
+            first = calibrate_io_sectors()
+            first["output_multipliers"].clear()
+            second = calibrate_io_sectors()
+        fetch.assert_called_once()
+        assert second["output_multipliers"]
+
+    def test_multiplier_counts_suppliers_outside_sectors(self) -> None:
+
+        io_table = {
+            "sectors": ["a", "b"],
+            "use_coefficients": {
+                "a": {"a": 0.1, "b": 0.2, "imports": 0.2},
+                "b": {"a": 0.995},
+            },
+            "final_demand_shares": {"a": 0.5, "b": 0.5},
+        }
+        with patch(
+            "companies_house_abm.data_sources.calibration.fetch_input_output_table",
+            return_value=io_table,
+        ):
+            data = calibrate_io_sectors()
+        assert data["output_multipliers"]["a"] == pytest.approx(1.0 / 0.5)
+        assert data["output_multipliers"]["b"] == 1.0
+
 
 class TestCalibrateModel:
     def test_returns_model_config(self) -> None:
@@ -727,6 +806,30 @@ class TestCalibrateModel:
             cfg = calibrate_model()
         assert cfg.fiscal_rule.tax_rate_corporate == pytest.approx(0.25)
 
+    def test_failed_sub_calibration_falls_back_to_base(self) -> None:
+
+        base = ModelConfig()
+        with (
+            patch(
+                "companies_house_abm.data_sources.calibration.calibrate_households",
+                side_effect=RuntimeError("boom"),
+            ),
+            patch(
+                "companies_house_abm.data_sources.calibration.calibrate_banks",
+                return_value=(base.banks, base.bank_behavior),
+            ),
+            patch(
+                "companies_house_abm.data_sources.calibration.calibrate_government",
+                return_value=(base.fiscal_rule, base.transfers),
+            ),
+            patch(
+                "companies_house_abm.data_sources.calibration.calibrate_housing",
+                return_value=(base.properties, base.housing_market),
+            ),
+        ):
+            cfg = calibrate_model(base)
+        assert cfg.households == base.households
+
 
 # ---------------------------------------------------------------------------
 # HTTP utility tests
@@ -844,6 +947,30 @@ class TestFetchSicCodesNormalise:
         assert len(df) == 1
         assert df["sic_code"][0] == "62020"
 
+    def test_keeps_leading_zero_sic_and_drops_signed(self) -> None:
+
+        raw = pl.DataFrame(
+            {
+                " CompanyNumber": ["12345678", "87654321"],
+                "SICCode.SicText_1": ["01110 - Growing cereals", "+1234 - bogus"],
+            }
+        )
+        df = _normalise(raw)
+        assert df["sic_code"].to_list() == ["01110"]
+
+    def test_drops_non_ascii_sic_codes(self) -> None:
+
+        raw = pl.DataFrame(
+            {
+                " CompanyNumber": ["12345678", "87654321"],
+                # Arabic-Indic digits and an accented letter: five characters
+                # each, but not an ASCII SIC code.
+                "SICCode.SicText_1": ["\u0666\u0662\u0660\u0662\u0660", "6202\u00e9"],
+            }
+        )
+        df = _normalise(raw)
+        assert len(df) == 0
+
     def test_drops_null_rows(self) -> None:
 
         raw = pl.DataFrame(
@@ -889,6 +1016,20 @@ class TestParseBulkZip:
         assert "SICCode.SicText_1" in raw.columns
         assert len(raw) == 1
 
+    def test_projects_only_needed_columns(self, tmp_path: Any) -> None:
+
+        rows = [
+            {
+                " CompanyNumber": "12345678",
+                "SICCode.SicText_1": "62020 - Computer programming",
+                "CompanyName": "Test Co",
+            }
+        ]
+        (tmp_path / "test.zip").write_bytes(_make_fake_bulk_zip(rows))
+
+        raw = _parse_bulk_zip(str(tmp_path / "test.zip"))
+        assert raw.columns == [" CompanyNumber", "SICCode.SicText_1"]
+
     def test_raises_on_zip_with_no_csv(self, tmp_path: Any) -> None:
 
         zip_buf = _io.BytesIO()
@@ -901,6 +1042,20 @@ class TestParseBulkZip:
             _parse_bulk_zip(zip_path)
 
 
+class TestStreamToTempfile:
+    def test_copies_response_body_to_disk(self) -> None:
+        body = b"PK" + bytes(range(256)) * 9000  # spans several copy chunks
+        with patch(
+            "uk_data.adapters.companies_house.urllib.request.urlopen",
+            return_value=_io.BytesIO(body),
+        ):
+            path = Path(_stream_to_tempfile("https://example.com/bulk.zip"))
+        try:
+            assert path.read_bytes() == body
+        finally:
+            path.unlink()
+
+
 class TestFetchSicCodes:
     def test_returns_dataframe_on_success(self, tmp_path: Any) -> None:
         rows = [
@@ -948,12 +1103,13 @@ class TestFetchSicCodes:
             (tmp_path / "fake.zip").write_bytes(fake_zip)
             mock_stream.return_value = zip_path
 
-            fetch_sic_codes(output_path=out_path)
+            df = fetch_sic_codes(output_path=out_path)
 
         assert out_path.exists()
 
         loaded = pl.read_parquet(out_path)
         assert "sic_code" in loaded.columns
+        assert loaded.equals(df)
 
     def test_raises_when_all_urls_fail(self) -> None:
 
@@ -997,6 +1153,67 @@ class TestFetchSicCodes:
         assert len(df) == 1
 
 
+class TestBulkZipCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setenv("UK_DATA_CH_BULK_CACHE", "1")
+        cache = tmp_path / "cache"
+        monkeypatch.setattr(
+            "uk_data.adapters.companies_house._bulk_cache_dir", lambda: cache
+        )
+        monkeypatch.setattr(
+            "uk_data.adapters.companies_house._candidate_urls",
+            lambda: ["https://example.com/BasicCompanyDataAsOneFile-2024-01-01.zip"],
+        )
+        return cache
+
+    def test_reuses_cached_download(self, cache_dir: Path) -> None:
+        fake_zip = _make_fake_bulk_zip(
+            [
+                {
+                    " CompanyNumber": "12345678",
+                    "SICCode.SicText_1": "62020 - Computer programming",
+                    "CompanyName": "Test Co",
+                }
+            ]
+        )
+
+        def _fake_stream(url: str, directory: Path | None = None) -> str:
+            assert directory == cache_dir
+            path = directory / "partial.zip"
+            path.write_bytes(fake_zip)
+            return str(path)
+
+        with patch(
+            "uk_data.adapters.companies_house._stream_to_tempfile",
+            side_effect=_fake_stream,
+        ) as mock_stream:
+            first = fetch_sic_codes()
+            second = fetch_sic_codes()
+
+        mock_stream.assert_called_once()
+        assert first.equals(second)
+        assert [p.name for p in cache_dir.iterdir()] == [
+            "BasicCompanyDataAsOneFile-2024-01-01.zip"
+        ]
+
+    def test_discards_unparseable_cached_copy(self, cache_dir: Path) -> None:
+        cache_dir.mkdir()
+        bad = cache_dir / "BasicCompanyDataAsOneFile-2024-01-01.zip"
+        bad.write_bytes(b"not a zip")
+
+        with (
+            patch(
+                "uk_data.adapters.companies_house._stream_to_tempfile"
+            ) as mock_stream,
+            pytest.raises(RuntimeError, match="Could not download"),
+        ):
+            fetch_sic_codes()
+
+        mock_stream.assert_not_called()
+        assert not bad.exists()
+
+
 # ---------------------------------------------------------------------------
 # CLI fetch-data command tests
 # ---------------------------------------------------------------------------
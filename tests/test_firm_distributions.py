@@ -315,6 +315,10 @@ class TestSICToSector:
             assert len(key) == 2
             assert key.isdigit()
 
+    def test_sic_to_sector_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            SIC_TO_SECTOR["00"] = "agriculture"  # type: ignore[index]
+
 
 # =====================================================================
 # Constants
@@ -430,6 +434,28 @@ class TestLoadAccounts:
         dates = result["balance_sheet_date"]
         assert dates.min().year >= 1990  # type: ignore[union-attr]
 
+    def test_date_range_bounds_are_inclusive(self, tmp_path: Path) -> None:
+        df = _make_accounts_df(3).with_columns(
+            pl.Series(
+                "balance_sheet_date",
+                [date(1990, 1, 1), date(2030, 12, 31), date(2031, 1, 1)],
+            )
+        )
+        path = tmp_path / "bounds.parquet"
+        df.write_parquet(path)
+
+        result = load_accounts(path).collect()
+        assert result["balance_sheet_date"].to_list() == [
+            date(1990, 1, 1),
+            date(2030, 12, 31),
+        ]
+
+    def test_row_filters_are_pushed_into_scan(self, parquet_path: Path) -> None:
+        plan = load_accounts(parquet_path).explain()
+        scan = plan[plan.index("Parquet SCAN") :]
+        assert "is_between" in scan
+        assert 'col("error")' in scan
+
 
 # =====================================================================
 # Sector assignment
@@ -550,6 +576,12 @@ class TestProfileAccounts:
         for col in FIRM_FIELD_MAP.values():
             assert col in field_names
 
+    def test_matches_per_field_profiles(self, parquet_path: Path) -> None:
+        df: pl.DataFrame = load_accounts(parquet_path).collect()
+        profile = profile_accounts(df)
+        for fp in profile.fields:
+            assert fp == profile_field(df[fp.name].cast(pl.Float64, strict=False))
+
     def test_date_range(self, parquet_path: Path) -> None:
         df: pl.DataFrame = load_accounts(parquet_path).collect()
         profile = profile_accounts(df)
@@ -609,6 +641,27 @@ class TestFitDistribution:
         assert result is not None
         assert result.n_observations <= 100
 
+    def test_nulls_and_infinities_are_ignored(self) -> None:
+
+        rng = np.random.default_rng(7)
+        values = rng.normal(100, 20, 200).tolist()
+        clean = fit_distribution(pl.Series("x", values), "test", ("norm",))
+        noisy = fit_distribution(
+            pl.Series("x", [*values, None, float("inf"), float("-inf"), None]),
+            "test",
+            ("norm",),
+        )
+        assert clean is not None
+        assert noisy == clean
+
+    def test_accepts_integer_series(self) -> None:
+
+        rng = np.random.default_rng(3)
+        series = pl.Series("ints", rng.integers(1, 1000, 200))
+        result = fit_distribution(series, "test", ("norm",))
+        assert result is not None
+        assert result.n_observations == 200
+
     def test_ks_test_values(self) -> None:
 
         rng = np.random.default_rng(42)
@@ -709,6 +762,15 @@ class TestComputeSectorYearParameters:
             for d in r.distributions:
                 assert d.distribution in ("norm", "lognorm")
 
+    def test_parallel_matches_serial(self, parquet_path: Path) -> None:
+        lf = load_accounts(parquet_path)
+        lf = assign_sectors(lf, sic_path=None)
+        df: pl.DataFrame = lf.collect()
+
+        serial = compute_sector_year_parameters(df, workers=1)
+        parallel = compute_sector_year_parameters(df, workers=2)
+        assert parallel == serial
+
 
 # =====================================================================
 # Build summary
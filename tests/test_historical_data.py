@@ -9,10 +9,10 @@ from unittest.mock import patch
 
 import pytest
 
+from uk_data.adapters.boe import _parse_iadb_csv
 from uk_data.adapters.historical import (
     _build_iadb_url,
     _parse_boe_date,
-    _parse_iadb_csv,
     _quarterly_last,
     _to_quarter_label,
     fetch_all_historical,
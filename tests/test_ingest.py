@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from decimal import Decimal
 from typing import TYPE_CHECKING
@@ -248,6 +249,13 @@ class TestZipBytesIter:
         result = b"".join(_zip_bytes_iter(path))
         assert result == content
 
+    def test_chunks_bounded_by_chunk_size(self, tmp_path: Path):
+        path = tmp_path / "test.zip"
+        path.write_bytes(b"x" * 10)
+        with patch("companies_house.ingest.xbrl._ZIP_CHUNK_SIZE", 4):
+            chunks = list(_zip_bytes_iter(path))
+        assert [len(c) for c in chunks] == [4, 4, 2]
+
 
 # ---------------------------------------------------------------------------
 # TestIngestFromZips
@@ -266,6 +274,34 @@ class TestIngestFromZips:
             result = ingest_from_zips([zip_path])
         assert len(result) == 2
 
+    def test_rows_converted_across_batches(self, tmp_path: Path):
+        zip_path = tmp_path / "test.zip"
+        with ZipFile(zip_path, "w") as zf:
+            zf.writestr("dummy.txt", "dummy")
+
+        rows = [_make_row(company_id=str(i)) for i in range(5)]
+        with (
+            _mock_stream_read_xbrl_zip(rows),
+            patch("companies_house.ingest.xbrl._ROW_BATCH_SIZE", 2),
+        ):
+            result = ingest_from_zips([zip_path])
+        assert result["company_id"].to_list() == ["0", "1", "2", "3", "4"]
+        assert result.schema == COMPANIES_HOUSE_SCHEMA
+
+    def test_excess_decimal_places_rounded_to_schema_scale(self, tmp_path: Path):
+        zip_path = tmp_path / "test.zip"
+        with ZipFile(zip_path, "w") as zf:
+            zf.writestr("dummy.txt", "dummy")
+
+        rows = [
+            _make_row(company_id="A"),
+            _make_row(company_id="B", profit_loss_for_period=Decimal("12.345")),
+        ]
+        with _mock_stream_read_xbrl_zip(rows):
+            result = ingest_from_zips([zip_path])
+        assert result.equals(_make_df(rows))
+        assert result["profit_loss_for_period"][1] == Decimal("12.34")
+
     def test_corrupt_zip_skipped(self, tmp_path: Path):
         zip_path = tmp_path / "bad.zip"
         zip_path.write_bytes(b"not a zip")
@@ -274,6 +310,28 @@ class TestIngestFromZips:
         assert len(result) == 0
         assert result.schema == COMPANIES_HOUSE_SCHEMA
 
+    def test_parallel_keeps_zip_order(self, tmp_path: Path):
+        zip_paths = []
+        for name in ("a", "b", "c"):
+            zip_path = tmp_path / f"{name}.zip"
+            with ZipFile(zip_path, "w") as zf:
+                zf.writestr("dummy.txt", "dummy")
+            zip_paths.append(zip_path)
+
+        @contextmanager
+        def fake_zip(zip_bytes_iter, zip_url=None):
+            yield (_COLUMNS, iter([_make_row(zip_url=zip_url)]))
+
+        # Threads stand in for processes so the patched parser is visible.
+        with (
+            patch("companies_house.ingest.xbrl.stream_read_xbrl_zip", fake_zip),
+            patch(
+                "companies_house.ingest.xbrl.ProcessPoolExecutor", ThreadPoolExecutor
+            ),
+        ):
+            result = ingest_from_zips(zip_paths, workers=3)
+        assert result["zip_url"].to_list() == [str(p) for p in zip_paths]
+
     def test_empty_list_returns_empty_df(self):
         result = ingest_from_zips([])
         assert len(result) == 0
@@ -318,8 +376,7 @@ class TestMergeAndWrite:
     def test_new_data_only(self, tmp_path: Path):
         output = tmp_path / "out.parquet"
         df = _make_df([_make_row(company_id="A")])
-        result = merge_and_write(df, output)
-        assert len(result) == 1
+        assert merge_and_write(df, output) == 1
         assert output.exists()
 
     def test_merge_with_existing_dedup(self, tmp_path: Path):
@@ -328,19 +385,40 @@ class TestMergeAndWrite:
         # Same row in both - should be deduped
         row = _make_row(company_id="A")
         _make_df([row]).write_parquet(existing_path)
-        result = merge_and_write(_make_df([row]), output, existing_path=existing_path)
-        assert len(result) == 1
+        n_rows = merge_and_write(_make_df([row]), output, existing_path=existing_path)
+        assert n_rows == 1
+        assert pl.read_parquet(output).height == 1
 
     def test_merge_with_new_rows(self, tmp_path: Path):
         existing_path = tmp_path / "existing.parquet"
         output = tmp_path / "out.parquet"
         _make_df([_make_row(company_id="A")]).write_parquet(existing_path)
-        result = merge_and_write(
+        n_rows = merge_and_write(
             _make_df([_make_row(company_id="B")]),
             output,
             existing_path=existing_path,
         )
-        assert len(result) == 2
+        assert n_rows == 2
+        assert pl.read_parquet(output).height == 2
+
+    def test_merge_in_place_overwrites_existing(self, tmp_path: Path):
+        output = tmp_path / "out.parquet"
+        _make_df(
+            [
+                _make_row(company_id="A", entity_current_legal_name="Old Name"),
+                _make_row(company_id="B"),
+            ]
+        ).write_parquet(output)
+        n_rows = merge_and_write(
+            _make_df([_make_row(company_id="A", entity_current_legal_name="New")]),
+            output,
+            existing_path=output,
+        )
+        result = pl.read_parquet(output)
+        assert n_rows == 2
+        assert result["company_id"].to_list() == ["B", "A"]
+        assert result["entity_current_legal_name"].to_list() == ["Test Co", "New"]
+        assert [p.name for p in tmp_path.iterdir()] == ["out.parquet"]
 
 
 # ---------------------------------------------------------------------------
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import dataclasses
+from unittest.mock import patch
 
 import pytest
+from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
 from companies_house_abm.abm.config import ModelConfig, load_config
-from companies_house_abm.webapp.app import _config_to_params, _params_to_config
+from companies_house_abm.webapp.app import (
+    _config_to_params,
+    _default_config,
+    _params_to_config,
+    app,
+    get_defaults,
+)
 from companies_house_abm.webapp.models import SimulationParams
 
 
@@ -171,3 +179,33 @@ class TestParamsToConfig:
         assert cfg.goods_market.search_intensity == pytest.approx(0.7)
         assert cfg.credit_market.collateral_requirement == pytest.approx(0.3)
         assert cfg.credit_market.default_rate_base == pytest.approx(0.02)
+
+
+class TestGetDefaults:
+    """Tests for the /api/defaults handler."""
+
+    def test_config_loaded_once(self) -> None:
+
+        _default_config.cache_clear()
+        with patch(
+            "companies_house_abm.webapp.app.load_config", wraps=load_config
+        ) as load:
+            first = get_defaults()
+            second = get_defaults()
+        _default_config.cache_clear()
+        load.assert_called_once()
+        assert first.params == second.params == _config_to_params(load_config())
+
+    def test_responses_are_independent(self) -> None:
+
+        first = get_defaults()
+        first.params.periods = 11
+        assert get_defaults().params.periods != 11
+
+    def test_response_gzipped_when_accepted(self) -> None:
+
+        client = TestClient(app)
+        response = client.get("/api/defaults", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["params"]["periods"] >= 10